@@ -0,0 +1,29 @@
+"""add_responses_created_at_index
+
+Revision ID: 07c5aedfb480
+Revises: 571f2c1f0ad6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '07c5aedfb480'
+down_revision: Union[str, Sequence[str], None] = '571f2c1f0ad6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Index on created_at so admin statistics can use range scans
+    op.create_index('idx_responses_created_at', 'responses', ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_responses_created_at', table_name='responses')
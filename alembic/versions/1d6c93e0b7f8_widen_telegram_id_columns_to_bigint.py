@@ -0,0 +1,48 @@
+"""widen_telegram_id_columns_to_bigint
+
+Revision ID: 1d6c93e0b7f8
+Revises: f4b08d2c6a19
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d6c93e0b7f8'
+down_revision: Union[str, Sequence[str], None] = 'f4b08d2c6a19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs holding Telegram chat, user or message ids
+_TELEGRAM_ID_COLUMNS = (
+    ('channels', 'channel_id'),
+    ('channels', 'discussion_group_id'),
+    ('comments', 'message_id'),
+    ('comments', 'user_id'),
+    ('boosted_posts', 'post_id'),
+    ('activity_logs', 'post_id'),
+    ('blacklist', 'user_id'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite integers are already 64-bit
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    
+    for table, column in _TELEGRAM_ID_COLUMNS:
+        op.alter_column(table, column, type_=sa.BigInteger(), existing_type=sa.Integer())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    
+    for table, column in _TELEGRAM_ID_COLUMNS:
+        op.alter_column(table, column, type_=sa.Integer(), existing_type=sa.BigInteger())
@@ -0,0 +1,31 @@
+"""add_boosted_posts_channel_timestamp_index
+
+Revision ID: 3b7d2e91c4a5
+Revises: 9e9ef0a6ceb7
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2e91c4a5'
+down_revision: Union[str, Sequence[str], None] = '9e9ef0a6ceb7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Recent boosts per channel become an index range scan instead of a sort
+    op.create_index(
+        'idx_bp_channel_ts', 'boosted_posts', ['channel_id', 'boost_timestamp']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_bp_channel_ts', table_name='boosted_posts')
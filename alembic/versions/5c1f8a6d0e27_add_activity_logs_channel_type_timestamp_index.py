@@ -0,0 +1,32 @@
+"""add_activity_logs_channel_type_timestamp_index
+
+Revision ID: 5c1f8a6d0e27
+Revises: 3b7d2e91c4a5
+Create Date: 2026-10-16 13:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f8a6d0e27'
+down_revision: Union[str, Sequence[str], None] = '3b7d2e91c4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Per-type activity history for a channel without post-filtering other types
+    op.create_index(
+        'idx_channel_type_ts', 'activity_logs',
+        ['channel_id', 'activity_type', 'timestamp']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_channel_type_ts', table_name='activity_logs')
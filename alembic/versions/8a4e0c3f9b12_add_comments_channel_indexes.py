@@ -0,0 +1,50 @@
+"""add_comments_channel_indexes
+
+Revision ID: 8a4e0c3f9b12
+Revises: 5c1f8a6d0e27
+Create Date: 2026-10-16 13:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4e0c3f9b12'
+down_revision: Union[str, Sequence[str], None] = '5c1f8a6d0e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_comments_channel_processed', 'comments', ['channel_id', 'processed']
+    )
+    # Keep the oldest row of each duplicated (channel_id, message_id) pair:
+    # point responses at it, then drop the later copies
+    op.execute(
+        "UPDATE responses SET comment_id = ("
+        " SELECT min(kept.id) FROM comments AS kept"
+        " JOIN comments AS dup"
+        " ON dup.channel_id = kept.channel_id AND dup.message_id = kept.message_id"
+        " WHERE dup.id = responses.comment_id"
+        ")"
+    )
+    op.execute(
+        "DELETE FROM comments WHERE id NOT IN ("
+        " SELECT min(id) FROM comments GROUP BY channel_id, message_id"
+        ")"
+    )
+    op.create_index(
+        'idx_comments_channel_message', 'comments', ['channel_id', 'message_id'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_comments_channel_message', table_name='comments')
+    op.drop_index('idx_comments_channel_processed', table_name='comments')
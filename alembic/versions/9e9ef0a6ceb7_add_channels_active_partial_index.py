@@ -0,0 +1,33 @@
+"""add_channels_active_partial_index
+
+Revision ID: 9e9ef0a6ceb7
+Revises: 07c5aedfb480
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e9ef0a6ceb7'
+down_revision: Union[str, Sequence[str], None] = '07c5aedfb480'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index covering only active channels (PostgreSQL and SQLite)
+    op.create_index(
+        'ix_channels_active', 'channels', ['id'],
+        postgresql_where=sa.text('is_active'),
+        sqlite_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_channels_active', table_name='channels')
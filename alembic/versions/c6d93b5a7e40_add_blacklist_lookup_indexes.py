@@ -0,0 +1,37 @@
+"""add_blacklist_lookup_indexes
+
+Revision ID: c6d93b5a7e40
+Revises: 8a4e0c3f9b12
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d93b5a7e40'
+down_revision: Union[str, Sequence[str], None] = '8a4e0c3f9b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_bl_type_active_channel', 'blacklist',
+        ['entry_type', 'is_active', 'channel_id']
+    )
+    # Partial index skipping keyword/pattern rows (full index outside PostgreSQL)
+    op.create_index(
+        'idx_bl_user', 'blacklist', ['user_id'],
+        postgresql_where=sa.text('user_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_bl_user', table_name='blacklist')
+    op.drop_index('idx_bl_type_active_channel', table_name='blacklist')
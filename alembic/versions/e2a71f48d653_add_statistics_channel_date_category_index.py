@@ -0,0 +1,33 @@
+"""add_statistics_channel_date_category_index
+
+Revision ID: e2a71f48d653
+Revises: c6d93b5a7e40
+Create Date: 2026-10-16 13:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a71f48d653'
+down_revision: Union[str, Sequence[str], None] = 'c6d93b5a7e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Natural key of a daily statistics row
+    op.create_index(
+        'ux_stats_channel_date_cat', 'statistics',
+        ['channel_id', 'stat_date', 'category'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_stats_channel_date_cat', table_name='statistics')
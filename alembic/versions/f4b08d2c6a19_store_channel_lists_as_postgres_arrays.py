@@ -0,0 +1,66 @@
+"""store_channel_lists_as_postgres_arrays
+
+Revision ID: f4b08d2c6a19
+Revises: e2a71f48d653
+Create Date: 2026-10-16 13:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b08d2c6a19'
+down_revision: Union[str, Sequence[str], None] = 'e2a71f48d653'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other dialects keep the JSON columns; the model only switches on PostgreSQL
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    # ALTER ... USING cannot hold a subquery, so unpack the JSON arrays through
+    # a session-local helper
+    op.execute(
+        "CREATE FUNCTION pg_temp.json_text_array(j json) RETURNS text[] "
+        "LANGUAGE sql IMMUTABLE AS "
+        "$$ SELECT coalesce(array_agg(x), '{}') FROM json_array_elements_text(j) AS x $$"
+    )
+    op.alter_column(
+        'channels', 'trigger_words',
+        type_=postgresql.ARRAY(sa.String()),
+        postgresql_using='pg_temp.json_text_array(trigger_words)::varchar[]'
+    )
+    op.alter_column(
+        'channels', 'admin_user_ids',
+        type_=postgresql.ARRAY(sa.BigInteger()),
+        postgresql_using='pg_temp.json_text_array(admin_user_ids)::bigint[]'
+    )
+    op.create_index(
+        'idx_channel_admins_gin', 'channels', ['admin_user_ids'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.drop_index('idx_channel_admins_gin', table_name='channels')
+    op.alter_column(
+        'channels', 'admin_user_ids',
+        type_=sa.JSON(),
+        postgresql_using='to_json(admin_user_ids)'
+    )
+    op.alter_column(
+        'channels', 'trigger_words',
+        type_=sa.JSON(),
+        postgresql_using='to_json(trigger_words)'
+    )
@@ -6,25 +6,41 @@ import logging
 from typing import Optional, Dict, List, Tuple
 from collections import deque
 from datetime import datetime
-from aiogram import Bot, Dispatcher
+from aiogram import Bot, Dispatcher, Router
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.types import Message, Update
+from aiogram.types import BotCommand, Message, Update
 from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 from aiohttp import web
+from sqlalchemy import select
 
 from .config import Config
 from .database import Database
-from .handlers.admin_handler import AdminHandler
+from .models import Channel
+from .handlers.admin_handler import AdminHandler, AdminOnlyMiddleware
 from .handlers.message_handler import MessageHandler
 from .handlers.autorepost_handler import AutoRepostHandler
 from .handlers.channel_qa_handler import ChannelQAHandler
 from .services.reaction_boost_service import ReactionBoostService
 from .services.post_monitor_service import PostMonitorService
 from .services.repost_scheduler import RepostScheduler
+from .services.technical_question_detector import TechnicalQuestionDetector
+from .services.technical_ai_service import TechnicalAIService
+from .services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
+# Reply for a bare /autorepost
+_MSG_AUTOREPOST_HELP = (
+    "📋 Auto-repost komandalar:\n\n"
+    "/autorepost add <source> <target> - Kanal qo'shish\n"
+    "/autorepost list - Kanallar ro'yxati\n"
+    "/autorepost remove <channel_id> - Kanalni o'chirish\n"
+    "/autorepost enable <channel_id> - Kanalni yoqish\n"
+    "/autorepost disable <channel_id> - Kanalni o'chirish\n"
+    "/autorepost stats [channel_id] - Statistika"
+)
+
 
 class BotHandler:
     """Main bot handler class"""
@@ -73,38 +89,42 @@ class BotHandler:
     
     def _register_handlers(self) -> None:
         """Register message handlers with dispatcher"""
-        # Admin commands
-        self.dp.message.register(
+        # Admin commands live on their own router so non-admins are turned
+        # away by one middleware once a command filter has matched
+        admin_router = Router(name="admin")
+        admin_router.message.middleware(AdminOnlyMiddleware(self.config.ADMIN_USER_IDS))
+        
+        admin_router.message.register(
             self.admin_handler.handle_start_command,
             lambda message: message.text and message.text.startswith('/start')
         )
         
-        self.dp.message.register(
+        admin_router.message.register(
             self.admin_handler.handle_stats_command,
             lambda message: message.text and message.text.startswith('/stats')
         )
         
-        self.dp.message.register(
+        admin_router.message.register(
             self.admin_handler.handle_settings_command,
             lambda message: message.text and message.text.startswith('/settings')
         )
         
-        self.dp.message.register(
+        admin_router.message.register(
             self.admin_handler.handle_boost_command,
             lambda message: message.text and message.text.startswith('/boost')
         )
         
-        self.dp.message.register(
+        admin_router.message.register(
             self.admin_handler.handle_fixchannel_command,
             lambda message: message.text and message.text.startswith('/fixchannel')
         )
         
-        self.dp.message.register(
+        admin_router.message.register(
             self.admin_handler.handle_boostmulti_command,
             lambda message: message.text and message.text.startswith('/boostmulti')
         )
         
-        self.dp.message.register(
+        admin_router.message.register(
             self.admin_handler.handle_customboost_command,
             lambda message: message.text and message.text.startswith('/customboost')
         )
@@ -141,11 +161,15 @@ class BotHandler:
             self._handle_channel_post
         )
         
-        # Regular messages (comments from discussion groups)
-        self.dp.message.register(
+        # Regular messages (comments from discussion groups); on a router
+        # included after the admin one so it does not swallow admin commands
+        fallback_router = Router(name="fallback")
+        fallback_router.message.register(
             self.message_handler.handle_message
         )
         
+        self.dp.include_routers(admin_router, fallback_router)
+        
         # Error handler
         self.dp.errors.register(self._error_handler)
     
@@ -190,7 +214,7 @@ class BotHandler:
             # Initialize RepostScheduler
             self.repost_scheduler = RepostScheduler(
                 self.bot,
-                self.database.session_maker,
+                self.database.async_session,
                 interval_seconds=120  # Check every 2 minutes
             )
             logger.info("RepostScheduler initialized")
@@ -205,18 +229,13 @@ class BotHandler:
             logger.info(f"Received channel post: chat_id={message.chat.id}, message_id={message.message_id}")
             
             # Get channel from database
-            from sqlalchemy import select
-            from .models import Channel
-            
-            session = await self.database.get_session()
-            try:
-                result = await session.execute(
+            async with self.database.session() as session:
+                channel = await session.scalar(
                     select(Channel).where(
                         Channel.channel_id == message.chat.id,
                         Channel.is_active == True
                     )
                 )
-                channel = result.scalar_one_or_none()
                 
                 if not channel:
                     logger.warning(f"Channel {message.chat.id} not found in database")
@@ -231,10 +250,6 @@ class BotHandler:
                 
                 # NEW: Handle Q&A for ALL channel posts with text
                 if message.text:
-                    from .services.technical_question_detector import TechnicalQuestionDetector
-                    from .services.technical_ai_service import TechnicalAIService
-                    from .services.ai_service import AIService
-                    
                     logger.info(f"Processing channel post {message.message_id} for Q&A")
                     
                     # Get conversation context for this channel
@@ -290,9 +305,6 @@ class BotHandler:
                         
                         logger.info(f"Response sent to channel post {message.message_id}")
                 
-            finally:
-                await session.close()
-                
         except Exception as e:
             logger.error(f"Error handling channel post: {e}", exc_info=True)
     
@@ -336,39 +348,32 @@ class BotHandler:
     async def _handle_autorepost_command(self, message: Message) -> None:
         """Handle /autorepost commands"""
         try:
-            session = await self.database.get_session()
-            
-            # Parse subcommand
-            parts = message.text.split()
-            if len(parts) < 2:
-                await message.reply(
-                    "📋 Auto-repost komandalar:\n\n"
-                    "/autorepost add <source> <target> - Kanal qo'shish\n"
-                    "/autorepost list - Kanallar ro'yxati\n"
-                    "/autorepost remove <channel_id> - Kanalni o'chirish\n"
-                    "/autorepost enable <channel_id> - Kanalni yoqish\n"
-                    "/autorepost disable <channel_id> - Kanalni o'chirish\n"
-                    "/autorepost stats [channel_id] - Statistika"
-                )
-                return
-            
-            subcommand = parts[1].lower()
-            
-            if subcommand == 'add':
-                await self.autorepost_handler.handle_autorepost_add(message, session)
-            elif subcommand == 'list':
-                await self.autorepost_handler.handle_autorepost_list(message, session)
-            elif subcommand == 'remove':
-                await self.autorepost_handler.handle_autorepost_remove(message, session)
-            elif subcommand == 'enable':
-                await self.autorepost_handler.handle_autorepost_enable(message, session)
-            elif subcommand == 'disable':
-                await self.autorepost_handler.handle_autorepost_disable(message, session)
-            elif subcommand == 'stats':
-                await self.autorepost_handler.handle_autorepost_stats(message, session)
-            else:
-                await message.reply(f"❌ Noma'lum komanda: {subcommand}")
+            async with self.database.session() as session:
+                # Parse subcommand
+                parts = message.text.split()
+                if len(parts) < 2:
+                    await message.reply(_MSG_AUTOREPOST_HELP)
+                    return
                 
+                # Subcommands get the already split arguments that follow them
+                subcommand = parts[1].lower()
+                args = parts[2:]
+                
+                if subcommand == 'add':
+                    await self.autorepost_handler.handle_autorepost_add(message, session, args)
+                elif subcommand == 'list':
+                    await self.autorepost_handler.handle_autorepost_list(message, session, args)
+                elif subcommand == 'remove':
+                    await self.autorepost_handler.handle_autorepost_remove(message, session, args)
+                elif subcommand == 'enable':
+                    await self.autorepost_handler.handle_autorepost_enable(message, session, args)
+                elif subcommand == 'disable':
+                    await self.autorepost_handler.handle_autorepost_disable(message, session, args)
+                elif subcommand == 'stats':
+                    await self.autorepost_handler.handle_autorepost_stats(message, session, args)
+                else:
+                    await message.reply(f"❌ Noma'lum komanda: {subcommand}")
+                    
         except Exception as e:
             logger.error(f"Error handling autorepost command: {e}", exc_info=True)
             await message.reply(f"❌ Xatolik: {e}")
@@ -424,8 +429,6 @@ class BotHandler:
     
     async def _set_bot_commands(self) -> None:
         """Set bot commands for better UX"""
-        from aiogram.types import BotCommand
-        
         commands = [
             BotCommand(command="start", description="Bot boshqaruv paneli"),
             BotCommand(command="stats", description="Statistika ko'rish"),
@@ -4,7 +4,7 @@ Handles environment variables and application settings
 """
 
 import os
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from dotenv import load_dotenv
 
 
@@ -43,7 +43,9 @@ class Config:
         
         # Admin Configuration
         admin_ids = os.getenv("ADMIN_USER_IDS", "")
-        self.ADMIN_USER_IDS = [int(uid.strip()) for uid in admin_ids.split(",") if uid.strip()]
+        self.ADMIN_USER_IDS: FrozenSet[int] = frozenset(
+            int(uid.strip()) for uid in admin_ids.split(",") if uid.strip()
+        )
     
     def get_ai_api_key(self, provider: str) -> Optional[str]:
         """Get API key for specified AI provider"""
@@ -3,6 +3,7 @@ Database connection and session management
 """
 
 import logging
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -24,6 +25,9 @@ class Database:
             self.database_url = database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
         elif database_url.startswith("sqlite://"):
             self.database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
+        # Convert postgres URLs (including sync driver ones) to asyncpg
+        elif database_url.startswith(("postgres://", "postgresql://", "postgresql+psycopg2://")):
+            self.database_url = "postgresql+asyncpg://" + database_url.split("://", 1)[1]
         
         # Create async engine
         engine_kwargs = {}
@@ -34,10 +38,25 @@ class Database:
                     "check_same_thread": False,
                 },
             })
+        else:
+            # Keep warm connections around for bursts of admin callbacks;
+            # recycling well inside server idle timeouts replaces the
+            # per-checkout ping
+            engine_kwargs.update({
+                "pool_size": 20,
+                "max_overflow": 40,
+                "pool_pre_ping": False,
+                "pool_recycle": 300,
+            })
+            if "+asyncpg" in self.database_url:
+                # asyncpg's own prepared statement cache, per connection
+                engine_kwargs["connect_args"] = {"statement_cache_size": 1024}
         
         self.engine = create_async_engine(
             self.database_url,
             echo=False,  # Set to True for SQL debugging
+            # Room for every module-level statement plus their per-dialect variants
+            query_cache_size=1200,
             **engine_kwargs
         )
         
@@ -67,6 +86,16 @@ class Database:
         """Get database session"""
         return self.async_session()
     
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Provide a session that is rolled back on error and always closed"""
+        async with self.async_session() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+    
     async def health_check(self) -> bool:
         """Check database connection health"""
         try:
@@ -4,18 +4,338 @@ Admin command handler for bot management
 
 import logging
 import asyncio
-from typing import Optional
-from aiogram import Bot
+import itertools
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import AbstractSet, Any, Awaitable, Callable, Final, NamedTuple, Optional, Union
+from aiogram import BaseMiddleware, Bot
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func, update, not_, cast, literal, true, Boolean, JSON, Integer, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
 from ..config import Config
 from ..database import Database
+from .common import MSG_NOT_ADMIN
 from ..models import Channel, Statistics, Response
+from ..models.reaction_settings import ReactionSettings
+from ..services.reaction_boost_service import ReactionBoostService
 
 logger = logging.getLogger(__name__)
 
+# Window in which rapid emoji taps are coalesced into a single write
+EMOJI_FLUSH_DELAY = 0.1
+
+# Seconds the active channel list is served from memory
+CHANNELS_CACHE_TTL = 30.0
+
+# Seconds the active channels looked up by /boost are reused before reloading
+ACTIVE_CHANNELS_TTL = 60.0
+
+# Seconds a channel row shown in the menus is reused before reloading
+CHANNEL_CACHE_TTL = 5.0
+
+# Text budget for one page of the channel list (Telegram allows 4096 chars)
+CHANNELS_PAGE_CHARS = 3500
+
+# Boost rounds of /boostmulti that may run at the same time
+BOOST_CONCURRENCY = 3
+
+# Seconds a resolved Telegram chat (id and title) is reused before asking again
+CHAT_CACHE_TTL = 3600.0
+
+# Number of edited admin messages whose last render is remembered
+RENDER_CACHE_SIZE = 1024
+
+# Open /customboost sessions kept in memory, and seconds before one expires
+CUSTOM_BOOST_MAX_SESSIONS = 256
+CUSTOM_BOOST_SESSION_TTL = 900.0
+
+# Telegram post links: t.me/<username>/<post_id> or t.me/c/<internal_id>/<post_id>
+_TME_LINK_RE = re.compile(r"^(?:https?://)?t\.me/(?:c/(\d+)|([^/\s]+))/(\d+)/?$")
+
+# Channel queries built once at import and run with bound parameters
+_STMT_ACTIVE_CHANNELS = select(Channel).where(Channel.is_active.is_(True))
+# Only the columns rendered in the channel list, in a stable order for seek paging
+_STMT_CHANNELS_PAGE = (
+    select(Channel.id, Channel.channel_title, Channel.channel_id, Channel.ai_enabled)
+    .where(Channel.is_active.is_(True), Channel.id > bindparam("after_id"))
+    .order_by(Channel.id)
+    .execution_options(yield_per=200)
+)
+
+
+class _ChatInfo(NamedTuple):
+    """The parts of a Telegram chat the admin commands use"""
+    id: int
+    title: Optional[str]
+
+
+class _FakeChat:
+    """Stand-in for Message.chat when boosting a post by id"""
+    __slots__ = ('id',)
+    
+    def __init__(self, chat_id: int):
+        self.id = chat_id
+
+
+class _FakeMessage:
+    """Stand-in for the Message that ReactionBoostService.boost_post expects"""
+    __slots__ = ('chat', 'message_id')
+    
+    def __init__(self, chat_id: int, message_id: int):
+        self.chat = _FakeChat(chat_id)
+        self.message_id = message_id
+
+
+# A rendered channel list page: text fragments, channel buttons, next page cursor
+_ChannelsPage = tuple[list[str], list[list[InlineKeyboardButton]], Optional[int]]
+
+# Read-only template for channels that have no reaction settings yet
+_DEFAULT_REACTION_SETTINGS = MappingProxyType({
+    'emojis': (),
+    'reaction_count': 3,
+    'delay_min': 2.0,
+    'delay_max': 8.0,
+    'auto_boost': True
+})
+
+# Emojis a channel starts with when reaction mode is first enabled
+_INITIAL_BOOST_EMOJIS: tuple[str, ...] = ('👍', '❤️', '🔥', '😍', '🎉')
+
+# Valid Telegram reaction emojis offered in the emoji picker, four per row
+_EMOJIS_PER_ROW = 4
+_EMOJI_ROWS: tuple[tuple[str, ...], ...] = (
+    ('👍', '👎', '❤️', '🔥'),
+    ('🥰', '👏', '😁', '🤔'),
+    ('🤯', '😱', '🤬', '😢'),
+    ('🎉', '🤩', '🤮', '💩'),
+    ('🙏', '👌', '🕊', '🤡'),
+)
+_REACTION_EMOJIS: tuple[str, ...] = tuple(emoji for row in _EMOJI_ROWS for emoji in row)
+
+# The same rows paired with each emoji's index in _REACTION_EMOJIS
+_INDEXED_EMOJI_ROWS: tuple[tuple[tuple[int, str], ...], ...] = tuple(
+    tuple((row_idx * _EMOJIS_PER_ROW + col_idx, emoji) for col_idx, emoji in enumerate(row))
+    for row_idx, row in enumerate(_EMOJI_ROWS)
+)
+
+# Repeat counts offered by /boostmulti and /customboost, three per row
+_BOOST_MULTI_COUNT_ROWS: tuple[tuple[int, ...], ...] = ((1, 2, 3), (4, 5, 10))
+
+# Labels indexed by a boolean flag (False -> 0, True -> 1) or keyed by channel mode
+_MODE_TEXT = MappingProxyType({
+    'comment': 'Faqat komentlarga javob',
+    'reaction': 'Faqat reaksiya qoshish',
+    'both': 'Ikkalasi ham'
+})
+_MODE_TEXT_DEFAULT: Final = 'Komentlarga javob'
+_AI_ICON: Final = ("🔴", "🟢")
+_AI_LIST_STATUS: Final = ('Ochirilgan', 'Yoqilgan')
+_AI_STATUS: Final = ("🔴 O'chirilgan", "🟢 Yoqilgan")
+_AI_TOGGLED: Final = ("ochirildi", "yoqildi")
+_AUTO_STATUS: Final = ("O'chirilgan", "Yoqilgan")
+
+# Static user-facing texts
+_MSG_NOT_ADMIN: Final = MSG_NOT_ADMIN
+_MSG_START_NOT_ADMIN: Final = (
+    "❌ Sizda admin huquqlari yo'q.\n"
+    "Bu bot faqat ro'yxatdan o'tgan adminlar uchun."
+)
+_MSG_MAIN_MENU: Final = (
+    "🤖 <b>Telegram AI Bot - Admin Panel</b>\n\n"
+    "Botni boshqarish uchun quyidagi tugmalardan foydalaning:"
+)
+_MSG_NO_CHANNELS: Final = (
+    "📢 <b>Kanallar</b>\n\n"
+    "Hozircha hech qanday kanal ulanmagan.\n"
+    "Kanal qo'shish uchun 'Kanal qo'shish' tugmasini bosing."
+)
+_MSG_ADD_HELP: Final = (
+    "➕ <b>Kanal qo'shish</b>\n\n"
+    "<b>Qadamlar:</b>\n"
+    "1. Botni kanalingizga admin qilib qo'shing\n"
+    "2. Kanal uchun discussion group yarating\n"
+    "3. Botni discussion groupga ham qo'shing\n"
+    "4. Discussion groupda /setup buyrug'ini yuboring\n\n"
+    "<b>Eslatma:</b> Bot faqat discussion group xabarlarini kuzatadi."
+)
+_MSG_PICK_EMOJIS: Final = (
+    "😊 <b>Emojilarni tanlang</b>\n\n"
+    "Quyidagi emojilardan tanlang (tugmani bosing):\n"
+)
+_MSG_PICK_COUNT: Final = (
+    "🔢 <b>Reaksiya sonini tanlang</b>\n\n"
+    "Har bir postga nechta reaksiya qo'shilsin?"
+)
+_MSG_CUSTOM_BOOST_PICK: Final = (
+    "😊 <b>Emojilarni tanlang</b>\n\n"
+    "Post: {post_link}\n\n"
+    "Qaysi emojilarni qo'shmoqchisiz? (bir nechta tanlash mumkin)"
+)
+
+# Static keyboards are built once and shared between calls
+_MAIN_MENU_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="📊 Statistika", callback_data="show_stats")],
+    [InlineKeyboardButton(text="📢 Kanallar", callback_data="show_channels")],
+    [InlineKeyboardButton(text="➕ Kanal qo'shish", callback_data="add_channel")],
+    [InlineKeyboardButton(text="⚙️ Sozlamalar", callback_data="show_settings")]
+])
+
+_NO_CHANNELS_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="➕ Kanal qo'shish", callback_data="add_channel")],
+    [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
+])
+
+_ADD_HELP_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🔙 Orqaga", callback_data="show_channels")]
+])
+
+_SETTINGS_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
+])
+
+_STATS_KB = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="🔄 Yangilash", callback_data="show_stats")],
+    [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
+])
+
+
+@lru_cache(maxsize=256)
+def _emoji_keyboard(channel_id: int) -> InlineKeyboardMarkup:
+    """Build the emoji picker keyboard for a channel"""
+    keyboard_buttons = [
+        [InlineKeyboardButton(text=emoji, callback_data=f"emoji_{channel_id}_{idx}") for idx, emoji in row]
+        for row in _INDEXED_EMOJI_ROWS
+    ]
+    keyboard_buttons.append([
+        InlineKeyboardButton(text="✅ Tayyor", callback_data=f"reaction_settings_{channel_id}")
+    ])
+    keyboard_buttons.append([
+        InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"reaction_settings_{channel_id}")
+    ])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+
+
+def _custom_boost_emoji_button(session_id: int, idx: int, selected: bool) -> InlineKeyboardButton:
+    """Build one /customboost emoji button"""
+    emoji = _REACTION_EMOJIS[idx]
+    return InlineKeyboardButton(text=f"✅ {emoji}" if selected else emoji, callback_data=f"cbs_{session_id}_e_{idx}")
+
+
+def _custom_boost_emoji_keyboard(session_id: int, selected: AbstractSet[int]) -> InlineKeyboardMarkup:
+    """Build the /customboost emoji keyboard, marking the selected emoji indexes"""
+    keyboard_buttons = [
+        [_custom_boost_emoji_button(session_id, idx, idx in selected) for idx, _ in row]
+        for row in _INDEXED_EMOJI_ROWS
+    ]
+    keyboard_buttons.append([
+        InlineKeyboardButton(text="✅ Tayyor (tanlangan emojilar bilan)", callback_data=f"cbs_{session_id}_done")
+    ])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+
+
+def _selected_emojis(indexes: AbstractSet[int]) -> list[str]:
+    """Emojis picked in a /customboost session, in keyboard order"""
+    return [_REACTION_EMOJIS[idx] for idx in sorted(indexes)]
+
+
+def _toggle_emojis(emojis: Any, toggled: AbstractSet[str]) -> list[str]:
+    """Drop toggled emojis that are present and append the ones that are not"""
+    current = list(emojis)
+    kept = [emoji for emoji in current if emoji not in toggled]
+    return kept + sorted(toggled.difference(current))
+
+
+@lru_cache(maxsize=256)
+def _count_keyboard(channel_id: int) -> InlineKeyboardMarkup:
+    """Build the reaction count keyboard for a channel"""
+    keyboard_buttons = [
+        [InlineKeyboardButton(text=f"{count} ta", callback_data=f"count_{channel_id}_{count}")]
+        for count in range(1, 6)
+    ]
+    keyboard_buttons.append([
+        InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"reaction_settings_{channel_id}")
+    ])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+
+
+@lru_cache(maxsize=256)
+def _channel_details_keyboard(channel_id: int, ai_enabled: bool, reaction_mode: bool) -> InlineKeyboardMarkup:
+    """Build the channel details keyboard for a channel's AI and mode state"""
+    if reaction_mode:
+        reaction_button = InlineKeyboardButton(
+            text="❤️ Reaksiya sozlamalari",
+            callback_data=f"reaction_settings_{channel_id}"
+        )
+    else:
+        reaction_button = InlineKeyboardButton(
+            text="❤️ Reaksiya rejimini yoqish",
+            callback_data=f"enable_reaction_{channel_id}"
+        )
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(
+            text="AI Ochirish" if ai_enabled else "AI Yoqish",
+            callback_data=f"toggle_ai_{channel_id}"
+        )],
+        [reaction_button],
+        [InlineKeyboardButton(text="🔙 Orqaga", callback_data="show_channels")]
+    ])
+
+
+@lru_cache(maxsize=256)
+def _reaction_settings_keyboard(channel_id: int, auto_boost: bool) -> InlineKeyboardMarkup:
+    """Build the reaction settings keyboard for a channel's auto-boost state"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="😊 Emojilarni o'zgartirish", callback_data=f"set_emojis_{channel_id}")],
+        [InlineKeyboardButton(text="🔢 Sonini o'zgartirish", callback_data=f"set_count_{channel_id}")],
+        [InlineKeyboardButton(
+            text="Auto-boost O'chirish" if auto_boost else "Auto-boost Yoqish",
+            callback_data=f"toggle_auto_{channel_id}"
+        )],
+        [InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"channel_{channel_id}")]
+    ])
+
+
+def _parse_tme_link(link: str) -> Optional[tuple[Union[int, str], int]]:
+    """Split a t.me post link into (channel, post_id)
+    
+    The channel is the full -100 chat id for private links and the
+    username for public ones. Returns None if the link is malformed.
+    """
+    match = _TME_LINK_RE.match(link)
+    if not match:
+        return None
+    private_id, username, post_id = match.groups()
+    if private_id is not None:
+        return int(f"-100{private_id}"), int(post_id)
+    return username, int(post_id)
+
+
+class AdminOnlyMiddleware(BaseMiddleware):
+    """Reply to non-admins and stop them before an admin command handler runs"""
+    
+    def __init__(self, admin_ids: AbstractSet[int]):
+        self.admin_ids = admin_ids
+    
+    async def __call__(
+        self,
+        handler: Callable[[Message, dict[str, Any]], Awaitable[Any]],
+        event: Message,
+        data: dict[str, Any]
+    ) -> Any:
+        if event.from_user is not None and event.from_user.id in self.admin_ids:
+            return await handler(event, data)
+        
+        refusal = _MSG_START_NOT_ADMIN if event.text.startswith('/start') else _MSG_NOT_ADMIN
+        await event.reply(refusal)
+        return None
+
 
 class AdminHandler:
     """Handler for admin commands and interface"""
@@ -24,50 +344,189 @@ class AdminHandler:
         self.bot = bot
         self.database = database
         self.config = config
-    
-    async def handle_start_command(self, message: Message) -> None:
-        """Handle /start command"""
-        user_id = message.from_user.id
         
-        # Check if user is admin
-        if user_id not in self.config.ADMIN_USER_IDS:
+        # Emoji toggles staged per channel and the task flushing them; the
+        # task stays in _emoji_pending until it returns, which both keeps it
+        # referenced and limits each channel to one flush at a time
+        self._emoji_dirty: dict[int, set[str]] = {}
+        self._emoji_pending: dict[int, asyncio.Task] = {}
+        
+        # First page of active channels shown by _show_channels; reset by every
+        # channel mutation
+        self._channels_cache: Optional[_ChannelsPage] = None
+        self._channels_cache_ts: float = 0.0
+        
+        # Active channels keyed by Telegram chat id, for /boost lookups, and the
+        # same rows keyed by Channel.id for the details screens
+        self._active_channels: Optional[dict[int, Channel]] = None
+        self._active_channels_by_id: dict[int, Channel] = {}
+        self._active_channels_ts: float = 0.0
+        
+        # Channel rows shown in the menus keyed by Channel.id, with their load time
+        self._channel_rows: dict[int, tuple[float, Channel]] = {}
+        
+        # Parsed reaction settings keyed by Channel.id, with the dict they came from
+        self._reaction_settings: dict[int, tuple[dict, ReactionSettings]] = {}
+        
+        # Resolved chats keyed by @username or chat id, with their fetch time
+        self._chat_cache: dict[Union[str, int], tuple[float, _ChatInfo]] = {}
+        
+        # Digest of the last view rendered into each (chat_id, message_id)
+        self._last_render: dict[tuple[int, int], int] = {}
+        
+        # Open /customboost sessions, least recently started first
+        self._custom_boost_selections: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._custom_boost_ids = itertools.count(1)
+        
+        # Callback routing tables: exact menu keys, "<verb>_<channel_id>"
+        # actions sharing one int() parse, and routes keyed by the first
+        # "_"-separated segment that parse the rest themselves
+        self._menu_routes = {
+            "main_menu": self._show_main_menu,
+            "show_channels": self._show_channels,
+            "add_channel": self._show_add_channel_help,
+            "show_stats": self._show_statistics,
+            "show_settings": self._show_settings_menu,
+        }
+        self._channel_routes = {
+            "channel": partial(self._show_channel_details, edit=True),
+            "show_channels_page": lambda message, after_id: self._show_channels(message, edit=True, after_id=after_id),
+            "toggle_ai": self._toggle_ai,
+            "reaction_settings": partial(self._show_reaction_settings, edit=True),
+            "enable_reaction": self._enable_reaction_mode,
+            "set_emojis": partial(self._prompt_set_emojis, edit=True),
+            "set_count": partial(self._prompt_set_count, edit=True),
+            "toggle_auto": self._toggle_auto_boost,
+        }
+        self._prefix_routes: dict[str, Callable[[Message, str], Optional[Awaitable[None]]]] = {
+            "emoji": self._route_emoji,
+            "count": self._route_count,
+            "bm": self._route_boost_multi,
+        }
+    
+    def _is_admin(self, user_id: int) -> bool:
+        """Check whether the user is a bot admin"""
+        return user_id in self.config.ADMIN_USER_IDS
+    
+    def _invalidate_channels(self) -> None:
+        """Drop cached channel data after a channel row changes"""
+        self._channels_cache = None
+        self._active_channels = None
+        self._active_channels_by_id = {}
+        self._channel_rows.clear()
+        self._reaction_settings.clear()
+    
+    async def _load_active_channels(self, session: AsyncSession) -> dict[int, Channel]:
+        """Active channels keyed by chat id, reloaded after ACTIVE_CHANNELS_TTL seconds"""
+        now = time.monotonic()
+        if self._active_channels is None or now - self._active_channels_ts >= ACTIVE_CHANNELS_TTL:
+            channels = (await session.scalars(_STMT_ACTIVE_CHANNELS)).all()
+            # Cached rows live outside any session; callers work on merged copies
+            for channel in channels:
+                session.expunge(channel)
+            self._active_channels = {channel.channel_id: channel for channel in channels}
+            self._active_channels_by_id = {channel.id: channel for channel in channels}
+            self._active_channels_ts = now
+        return self._active_channels
+    
+    async def _find_active_channel(self, session: AsyncSession, chat_id: int) -> Optional[Channel]:
+        """Look up an active channel by chat id in the cached map, reloading it once on a miss
+        
+        The cached row is shared and detached; the caller gets a copy attached
+        to ``session`` so changes made through it are flushed with that session.
+        """
+        channel = (await self._load_active_channels(session)).get(chat_id)
+        if channel is None:
+            # The cached set may predate a newly added channel
+            self._active_channels = None
+            channel = (await self._load_active_channels(session)).get(chat_id)
+        if channel is None:
+            return None
+        return await session.merge(channel, load=False)
+    
+    async def _get_channel(self, channel_id: int) -> Optional[Channel]:
+        """Load a channel for display, reusing cached rows where still fresh"""
+        cached = self._channel_rows.get(channel_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CHANNEL_CACHE_TTL:
+            return cached[1]
+        
+        # Active rows already loaded for a boost lookup serve drill-ins until they expire
+        if now - self._active_channels_ts < ACTIVE_CHANNELS_TTL:
+            channel = self._active_channels_by_id.get(channel_id)
+            if channel is not None:
+                return channel
+        
+        async with self.database.session() as session:
+            channel = await session.get(Channel, channel_id)
+        if channel is not None:
+            self._channel_rows[channel_id] = (now, channel)
+        return channel
+    
+    def _parse_reaction_settings(self, channel: Channel) -> ReactionSettings:
+        """ReactionSettings for a channel, reused while its settings dict is unchanged"""
+        # reaction_settings is a JSON column, so it is loaded with the row and
+        # needs no eager loading. Writes go through a separate session and end
+        # with _invalidate_channels, so an identity check is enough here.
+        source = channel.reaction_settings
+        cached = self._reaction_settings.get(channel.id)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        
+        settings = ReactionSettings.from_dict(source)
+        self._reaction_settings[channel.id] = (source, settings)
+        return settings
+    
+    async def _resolve_chat(self, ident: Union[str, int]) -> _ChatInfo:
+        """Resolve a chat via get_chat, reusing results for CHAT_CACHE_TTL seconds"""
+        cached = self._chat_cache.get(ident)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CHAT_CACHE_TTL:
+            return cached[1]
+        
+        chat = await self.bot.get_chat(ident)
+        info = _ChatInfo(chat.id, chat.title)
+        self._chat_cache[ident] = (now, info)
+        return info
+    
+    async def _resolve_post_link(self, message: Message, post_link: str) -> Optional[tuple[int, int]]:
+        """Resolve a t.me post link to (channel_id, post_id), replying on failure"""
+        parsed = _parse_tme_link(post_link)
+        if parsed is None:
             await message.reply(
-                "❌ Sizda admin huquqlari yo'q.\n"
-                "Bu bot faqat ro'yxatdan o'tgan adminlar uchun."
+                "❌ Link noto'g'ri formatda!\n\n"
+                "To'g'ri formatlar:\n"
+                "1. <code>https://t.me/channel/123</code>\n"
+                "2. <code>https://t.me/c/1234567890/123</code>"
             )
-            return
+            return None
         
+        channel, post_id = parsed
+        if isinstance(channel, int):
+            return channel, post_id
+        
+        try:
+            chat = await self._resolve_chat(f"@{channel}")
+        except Exception as e:
+            await message.reply(f"❌ Kanal topilmadi: @{channel}\n\nXatolik: {e}")
+            return None
+        return chat.id, post_id
+    
+    async def handle_start_command(self, message: Message) -> None:
+        """Handle /start command"""
         # Show main admin menu
         await self._show_main_menu(message)
     
     async def handle_stats_command(self, message: Message) -> None:
         """Handle /stats command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         await self._show_statistics(message)
     
     async def handle_settings_command(self, message: Message) -> None:
         """Handle /settings command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         await self._show_settings_menu(message)
     
     async def handle_boost_command(self, message: Message) -> None:
         """Handle /boost command - manually boost a post"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         # Parse command: /boost <channel_id> <message_id> OR /boost <post_link>
         parts = message.text.split()
         
@@ -75,44 +534,10 @@ class AdminHandler:
             # Post link format: /boost https://t.me/channel/123
             post_link = parts[1]
             
-            # Parse link
-            if 't.me/' in post_link:
-                try:
-                    # Extract channel and message ID from link
-                    # Format 1: https://t.me/username/123
-                    # Format 2: https://t.me/c/1234567890/123
-                    
-                    link_parts = post_link.split('/')
-                    
-                    if '/c/' in post_link:
-                        # Private channel: https://t.me/c/1234567890/123
-                        channel_id_str = link_parts[-2]
-                        post_id = int(link_parts[-1])
-                        channel_id = int(f"-100{channel_id_str}")
-                    else:
-                        # Public channel: https://t.me/username/123
-                        username = link_parts[-2]
-                        post_id = int(link_parts[-1])
-                        
-                        # Get channel info by username
-                        try:
-                            chat = await self.bot.get_chat(f"@{username}")
-                            channel_id = chat.id
-                        except Exception as e:
-                            await message.reply(f"❌ Kanal topilmadi: @{username}\n\nXatolik: {e}")
-                            return
-                    
-                except Exception as e:
-                    await message.reply(f"❌ Link noto'g'ri formatda!\n\nXatolik: {e}")
-                    return
-            else:
-                await message.reply(
-                    "❌ Noto'g'ri format!\n\n"
-                    "To'g'ri formatlar:\n"
-                    "1. <code>/boost https://t.me/channel/123</code>\n"
-                    "2. <code>/boost -1001234567890 123</code>"
-                )
+            resolved = await self._resolve_post_link(message, post_link)
+            if resolved is None:
                 return
+            channel_id, post_id = resolved
         
         elif len(parts) == 3:
             # Manual format: /boost <channel_id> <message_id>
@@ -135,104 +560,74 @@ class AdminHandler:
             return
         
         # Get channel from database
-        session = await self.database.get_session()
         try:
-            from sqlalchemy import select
-            result = await session.execute(
-                select(Channel).where(
-                    Channel.channel_id == channel_id,
-                    Channel.is_active == True
-                )
-            )
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                # Try to find channel by ID and update channel_id
-                result = await session.execute(select(Channel).where(Channel.is_active == True))
-                all_channels = result.scalars().all()
+            async with self.database.session() as session:
+                channel = await self._find_active_channel(session, channel_id)
                 
-                if all_channels:
-                    await message.reply(
-                        f"❌ Kanal topilmadi!\n\n"
-                        f"Mavjud kanallar:\n" +
-                        "\n".join([f"• {ch.channel_title} (ID: {ch.channel_id})" for ch in all_channels]) +
-                        f"\n\nAgar kanal ID noto'g'ri bo'lsa, /fixchannel {channel_id} buyrug'ini ishlating."
-                    )
-                else:
+                if not channel:
+                    all_channels = list((await self._load_active_channels(session)).values())
+                    
+                    if all_channels:
+                        await message.reply(
+                            f"❌ Kanal topilmadi!\n\n"
+                            f"Mavjud kanallar:\n" +
+                            "\n".join([f"• {ch.channel_title} (ID: {ch.channel_id})" for ch in all_channels]) +
+                            f"\n\nAgar kanal ID noto'g'ri bo'lsa, /fixchannel {channel_id} buyrug'ini ishlating."
+                        )
+                    else:
+                        await message.reply(
+                            f"❌ Kanal topilmadi!\n\n"
+                            f"Kanal ID: <code>{channel_id}</code>\n\n"
+                            f"Avval kanalni qo'shing: /start"
+                        )
+                    return
+                
+                if not channel.reaction_settings:
                     await message.reply(
-                        f"❌ Kanal topilmadi!\n\n"
-                        f"Kanal ID: <code>{channel_id}</code>\n\n"
-                        f"Avval kanalni qo'shing: /start"
+                        f"❌ Kanal uchun reaksiya sozlamalari yo'q!\n\n"
+                        f"Avval reaksiya sozlamalarini o'rnating:\n"
+                        f"/start → Kanallar → {channel.channel_title} → Reaksiya sozlamalari"
                     )
-                return
-            
-            if not channel.reaction_settings:
-                await message.reply(
-                    f"❌ Kanal uchun reaksiya sozlamalari yo'q!\n\n"
-                    f"Avval reaksiya sozlamalarini o'rnating:\n"
-                    f"/start → Kanallar → {channel.channel_title} → Reaksiya sozlamalari"
+                    return
+                
+                # Add reactions
+                settings = self._parse_reaction_settings(channel)
+                
+                # Create a fake Message object for boost_post
+                fake_msg = _FakeMessage(channel_id, post_id)
+                
+                # Initialize service
+                reaction_service = ReactionBoostService(self.bot, session)
+                
+                # The progress message is edited into the result instead of
+                # sending a second message
+                status = await message.reply(
+                    f"⏳ Reaksiyalar qo'shilmoqda...\n\n"
+                    f"Kanal: {channel.channel_title}\n"
+                    f"Post ID: {post_id}\n"
+                    f"Emojilar: {settings.display_emojis}"
                 )
-                return
-            
-            # Try to get the message
-            try:
-                msg = await self.bot.forward_message(
-                    chat_id=user_id,
-                    from_chat_id=channel_id,
-                    message_id=post_id
+                
+                # Boost the post
+                try:
+                    await reaction_service.boost_post(channel, fake_msg, force=True)
+                except Exception as e:
+                    await status.edit_text(f"❌ Xatolik: {str(e)}")
+                    logger.error("Error in boost command: %s", e, exc_info=True)
+                    return
+                
+                await status.edit_text(
+                    f"✅ Reaksiyalar qo'shildi!\n\n"
+                    f"Kanal: {channel.channel_title}\n"
+                    f"Post ID: {post_id}"
                 )
-                await msg.delete()
-            except Exception:
-                pass  # Message might not be forwardable
-            
-            # Add reactions
-            from ..services.reaction_boost_service import ReactionBoostService
-            from ..models.reaction_settings import ReactionSettings
-            
-            settings = ReactionSettings.from_dict(channel.reaction_settings)
-            
-            # Create a fake Message object for boost_post
-            class FakeMessage:
-                def __init__(self, chat_id, message_id):
-                    self.chat = type('obj', (object,), {'id': chat_id})()
-                    self.message_id = message_id
-            
-            fake_msg = FakeMessage(channel_id, post_id)
-            
-            # Initialize service
-            reaction_service = ReactionBoostService(self.bot, session)
-            
-            await message.reply(
-                f"⏳ Reaksiyalar qo'shilmoqda...\n\n"
-                f"Kanal: {channel.channel_title}\n"
-                f"Post ID: {post_id}\n"
-                f"Emojilar: {' '.join(settings.emojis[:settings.reaction_count])}"
-            )
-            
-            # Boost the post
-            await reaction_service.boost_post(channel, fake_msg, force=True)
-            
-            await message.reply(
-                f"✅ Reaksiyalar qo'shildi!\n\n"
-                f"Kanal: {channel.channel_title}\n"
-                f"Post ID: {post_id}"
-            )
-            
+                
         except Exception as e:
             await message.reply(f"❌ Xatolik: {str(e)}")
-            import logging
-            logging.error(f"Error in boost command: {e}", exc_info=True)
-        finally:
-            await session.close()
+            logger.error("Error in boost command: %s", e, exc_info=True)
     
     async def handle_fixchannel_command(self, message: Message) -> None:
         """Handle /fixchannel command - fix channel ID"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         # Parse command: /fixchannel <new_channel_id> or /fixchannel @username
         parts = message.text.split()
         if len(parts) != 2:
@@ -251,7 +646,7 @@ class AdminHandler:
         if channel_input.startswith('@'):
             # Username format
             try:
-                chat = await self.bot.get_chat(channel_input)
+                chat = await self._resolve_chat(channel_input)
                 new_channel_id = chat.id
                 channel_title = chat.title
             except Exception as e:
@@ -263,7 +658,7 @@ class AdminHandler:
                 new_channel_id = int(channel_input)
                 # Try to get channel info
                 try:
-                    chat = await self.bot.get_chat(new_channel_id)
+                    chat = await self._resolve_chat(new_channel_id)
                     channel_title = chat.title
                 except Exception:
                     channel_title = "Unknown"
@@ -271,47 +666,37 @@ class AdminHandler:
                 await message.reply("❌ Kanal ID raqam bo'lishi kerak yoki @ bilan boshlanishi kerak!")
                 return
         
-        session = await self.database.get_session()
         try:
-            from sqlalchemy import select
-            result = await session.execute(select(Channel).where(Channel.is_active == True))
-            channels = result.scalars().all()
-            
-            if not channels:
-                await message.reply("❌ Hech qanday kanal topilmadi!")
-                return
-            
-            # Update first channel
-            channel = channels[0]
-            old_id = channel.channel_id
-            channel.channel_id = new_channel_id
-            channel.channel_title = channel_title
-            await session.commit()
-            
-            await message.reply(
-                f"✅ Kanal ID yangilandi!\n\n"
-                f"Kanal: {channel_title}\n"
-                f"Eski ID: <code>{old_id}</code>\n"
-                f"Yangi ID: <code>{new_channel_id}</code>\n\n"
-                f"Endi /boost buyrug'ini ishlating:\n"
-                f"<code>/boost https://t.me/{channel_input.replace('@', '')}/&lt;post_id&gt;</code>"
-            )
-            
+            async with self.database.session() as session:
+                channels = (await session.scalars(_STMT_ACTIVE_CHANNELS)).all()
+                
+                if not channels:
+                    await message.reply("❌ Hech qanday kanal topilmadi!")
+                    return
+                
+                # Update first channel
+                channel = channels[0]
+                old_id = channel.channel_id
+                channel.channel_id = new_channel_id
+                channel.channel_title = channel_title
+                await session.commit()
+                self._invalidate_channels()
+                
+                await message.reply(
+                    f"✅ Kanal ID yangilandi!\n\n"
+                    f"Kanal: {channel_title}\n"
+                    f"Eski ID: <code>{old_id}</code>\n"
+                    f"Yangi ID: <code>{new_channel_id}</code>\n\n"
+                    f"Endi /boost buyrug'ini ishlating:\n"
+                    f"<code>/boost https://t.me/{channel_input.replace('@', '')}/&lt;post_id&gt;</code>"
+                )
+                
         except Exception as e:
             await message.reply(f"❌ Xatolik: {str(e)}")
-            import logging
-            logging.error(f"Error in fixchannel command: {e}", exc_info=True)
-        finally:
-            await session.close()
+            logger.error("Error in fixchannel command: %s", e, exc_info=True)
     
     async def handle_boostmulti_command(self, message: Message) -> None:
         """Handle /boostmulti command - boost a post multiple times"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         # Parse command: /boostmulti <post_link> <count>
         parts = message.text.split()
         
@@ -339,28 +724,18 @@ class AdminHandler:
                 return
         else:
             # Ask for count using inline keyboard
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-            
             # Store post link in a simpler format for callback
             # Use a simple counter instead of parsing the link
-            if not hasattr(self, '_custom_boost_counter'):
-                self._custom_boost_counter = 0
-            
-            self._custom_boost_counter += 1
-            callback_id = self._custom_boost_counter
+            callback_id = next(self._custom_boost_ids)
             callback_prefix = f"cb_{callback_id}"
             
-            keyboard_buttons = []
-            row = []
-            for count in [1, 2, 3, 4, 5, 10]:
-                row.append(InlineKeyboardButton(text=f"{count} marta", callback_data=f"{callback_prefix}_count_{count}"))
-                if len(row) == 3:
-                    keyboard_buttons.append(row)
-                    row = []
-            if row:
-                keyboard_buttons.append(row)
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+            keyboard = InlineKeyboardMarkup(inline_keyboard=[
+                [
+                    InlineKeyboardButton(text=f"{count} marta", callback_data=f"{callback_prefix}_count_{count}")
+                    for count in row
+                ]
+                for row in _BOOST_MULTI_COUNT_ROWS
+            ])
             
             await message.reply(
                 f"🔢 Necha marta reaksiya qo'shilsin?\n\n"
@@ -374,120 +749,96 @@ class AdminHandler:
     
     async def _boost_post_multiple_times(self, message: Message, post_link: str, count: int) -> None:
         """Boost a post multiple times"""
-        # Parse link
-        if 't.me/' not in post_link:
-            await message.reply("❌ Noto'g'ri link format!")
+        resolved = await self._resolve_post_link(message, post_link)
+        if resolved is None:
             return
+        channel_id, post_id = resolved
         
+        # Get channel from database
         try:
-            link_parts = post_link.split('/')
-            
-            if '/c/' in post_link:
-                # Private channel
-                channel_id_str = link_parts[-2]
-                post_id = int(link_parts[-1])
-                channel_id = int(f"-100{channel_id_str}")
-            else:
-                # Public channel
-                username = link_parts[-2]
-                post_id = int(link_parts[-1])
+            async with self.database.session() as session:
+                channel = await self._find_active_channel(session, channel_id)
                 
-                try:
-                    chat = await self.bot.get_chat(f"@{username}")
-                    channel_id = chat.id
-                except Exception as e:
-                    await message.reply(f"❌ Kanal topilmadi: @{username}\n\nXatolik: {e}")
+                if not channel:
+                    await message.reply(
+                        f"❌ Kanal topilmadi!\n\n"
+                        f"Kanal ID: <code>{channel_id}</code>\n\n"
+                        f"Avval /fixchannel buyrug'i bilan kanalni qo'shing."
+                    )
                     return
-        except Exception as e:
-            await message.reply(f"❌ Link noto'g'ri formatda!\n\nXatolik: {e}")
-            return
-        
-        # Get channel from database
-        session = await self.database.get_session()
-        try:
-            from sqlalchemy import select
-            result = await session.execute(
-                select(Channel).where(
-                    Channel.channel_id == channel_id,
-                    Channel.is_active == True
+                
+                if not channel.reaction_settings:
+                    await message.reply(
+                        f"❌ Kanal uchun reaksiya sozlamalari yo'q!\n\n"
+                        f"Avval reaksiya sozlamalarini o'rnating."
+                    )
+                    return
+                
+                # Initialize service
+                settings = self._parse_reaction_settings(channel)
+                
+                # Create fake message
+                fake_msg = _FakeMessage(channel_id, post_id)
+                
+                status = await message.reply(
+                    f"⏳ Reaksiyalar qo'shilmoqda...\n\n"
+                    f"Kanal: {channel.channel_title}\n"
+                    f"Post ID: {post_id}\n"
+                    f"Marta: {count}\n"
+                    f"Emojilar: {settings.display_emojis}"
                 )
-            )
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                await message.reply(
-                    f"❌ Kanal topilmadi!\n\n"
-                    f"Kanal ID: <code>{channel_id}</code>\n\n"
-                    f"Avval /fixchannel buyrug'i bilan kanalni qo'shing."
+                
+                # Boost multiple times, a few rounds at once. An AsyncSession must
+                # not be shared between concurrent tasks, so every round gets its
+                # own session and service. SQLite runs on a single shared
+                # connection, so there the rounds stay sequential.
+                concurrency = 1 if self.database.engine.dialect.name == "sqlite" else BOOST_CONCURRENCY
+                semaphore = asyncio.Semaphore(concurrency)
+                
+                async def boost_once() -> None:
+                    async with semaphore:
+                        async with self.database.session() as boost_session:
+                            # Attach to this round's session so a mode change made
+                            # by the service is committed with it
+                            round_channel = await boost_session.merge(channel, load=False)
+                            reaction_service = ReactionBoostService(self.bot, boost_session)
+                            await reaction_service.boost_post(round_channel, fake_msg, force=True)
+                
+                results = await asyncio.gather(
+                    *(boost_once() for _ in range(count)),
+                    return_exceptions=True
                 )
-                return
-            
-            if not channel.reaction_settings:
-                await message.reply(
-                    f"❌ Kanal uchun reaksiya sozlamalari yo'q!\n\n"
-                    f"Avval reaksiya sozlamalarini o'rnating."
+                
+                failures = [(i, result) for i, result in enumerate(results, 1) if isinstance(result, Exception)]
+                for i, error in failures:
+                    logger.warning(
+                        "Boost round %d/%d failed for post %s in %s",
+                        i, count, post_id, channel_id, exc_info=error
+                    )
+                total_reactions = (count - len(failures)) * settings.reaction_count
+                text = (
+                    f"✅ Reaksiyalar qo'shildi!\n\n"
+                    f"Kanal: {channel.channel_title}\n"
+                    f"Post ID: {post_id}\n"
+                    f"Jami: {total_reactions} ta reaksiya"
                 )
-                return
-            
-            # Initialize service
-            from ..services.reaction_boost_service import ReactionBoostService
-            from ..models.reaction_settings import ReactionSettings
-            
-            settings = ReactionSettings.from_dict(channel.reaction_settings)
-            reaction_service = ReactionBoostService(self.bot, session)
-            
-            # Create fake message
-            class FakeMessage:
-                def __init__(self, chat_id, message_id):
-                    self.chat = type('obj', (object,), {'id': chat_id})()
-                    self.message_id = message_id
-            
-            fake_msg = FakeMessage(channel_id, post_id)
-            
-            await message.reply(
-                f"⏳ Reaksiyalar qo'shilmoqda...\n\n"
-                f"Kanal: {channel.channel_title}\n"
-                f"Post ID: {post_id}\n"
-                f"Marta: {count}\n"
-                f"Emojilar: {' '.join(settings.emojis[:settings.reaction_count])}"
-            )
-            
-            # Boost multiple times
-            total_reactions = 0
-            for i in range(count):
-                try:
-                    await reaction_service.boost_post(channel, fake_msg, force=True)
-                    total_reactions += settings.reaction_count
-                    
-                    # Small delay between boosts
-                    if i < count - 1:
-                        await asyncio.sleep(1)
-                except Exception as e:
-                    await message.reply(f"❌ {i+1}-marta xatolik: {str(e)}")
-                    break
-            
-            await message.reply(
-                f"✅ Reaksiyalar qo'shildi!\n\n"
-                f"Kanal: {channel.channel_title}\n"
-                f"Post ID: {post_id}\n"
-                f"Jami: {total_reactions} ta reaksiya"
-            )
-            
+                if failures:
+                    i, error = failures[0]
+                    text += (
+                        f"\n\n❌ {len(failures)}/{count} xatolik\n"
+                        f"{i}-marta: {str(error)}"
+                    )
+                
+                await status.edit_text(text)
+                
         except Exception as e:
             await message.reply(f"❌ Xatolik: {str(e)}")
-            import logging
-            logging.error(f"Error in boostmulti command: {e}", exc_info=True)
-        finally:
-            await session.close()
+            logger.error("Error in boostmulti command: %s", e, exc_info=True)
     
     async def handle_customboost_command(self, message: Message) -> None:
         """Handle /customboost command - custom emoji and count selection"""
         user_id = message.from_user.id
         
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         # Parse command: /customboost <post_link>
         parts = message.text.split()
         
@@ -502,50 +853,19 @@ class AdminHandler:
         
         post_link = parts[1]
         
-        # Parse link to validate
-        if 't.me/' not in post_link:
+        # Validate the link up front with the same pattern used when boosting
+        if not _TME_LINK_RE.match(post_link):
             await message.reply("❌ Noto'g'ri link format!")
             return
         
-        # Initialize session storage
-        if not hasattr(self, '_custom_boost_selections'):
-            self._custom_boost_selections = {}
-        if not hasattr(self, '_custom_boost_counter'):
-            self._custom_boost_counter = 0
-        
         # Generate unique session ID
-        self._custom_boost_counter += 1
-        session_id = self._custom_boost_counter
+        session_id = next(self._custom_boost_ids)
         
         # Show emoji selection keyboard
-        from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        
-        # All valid Telegram reaction emojis (complete list)
-        emojis = [
-            '👍', '👎', '❤️', '🔥', '🥰', '👏', '😁', '🤔', '🤯', '😱',
-            '🤬', '😢', '🎉', '🤩', '🤮', '💩', '🙏', '👌', '🕊', '🤡'
-        ]
-        
-        keyboard_buttons = []
-        row = []
-        for idx, emoji in enumerate(emojis):
-            row.append(InlineKeyboardButton(text=emoji, callback_data=f"cbs_{session_id}_e_{idx}"))
-            if len(row) == 4:
-                keyboard_buttons.append(row)
-                row = []
-        if row:
-            keyboard_buttons.append(row)
-        
-        keyboard_buttons.append([
-            InlineKeyboardButton(text="✅ Tayyor (tanlangan emojilar bilan)", callback_data=f"cbs_{session_id}_done")
-        ])
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+        keyboard = _custom_boost_emoji_keyboard(session_id, frozenset())
         
         await message.reply(
-            f"😊 <b>Emojilarni tanlang</b>\n\n"
-            f"Post: {post_link}\n\n"
-            f"Qaysi emojilarni qo'shmoqchisiz? (bir nechta tanlash mumkin)",
+            _MSG_CUSTOM_BOOST_PICK.format(post_link=post_link),
             reply_markup=keyboard
         )
         
@@ -553,582 +873,515 @@ class AdminHandler:
         self._custom_boost_selections[session_id] = {
             'user_id': user_id,
             'post_link': post_link,
-            'emojis': [],
-            'emoji_list': emojis  # Store emoji list for reference
+            'emoji_indexes': set(),  # Indexes into _REACTION_EMOJIS
+            'keyboard': keyboard.inline_keyboard,  # Button rows, patched in place on toggles
+            'expires_at': time.monotonic() + CUSTOM_BOOST_SESSION_TTL
         }
+        # Drop the oldest sessions nobody finished
+        if len(self._custom_boost_selections) > CUSTOM_BOOST_MAX_SESSIONS:
+            self._custom_boost_selections.popitem(last=False)
     
     async def _handle_custom_boost_callback(self, callback: CallbackQuery) -> None:
         """Handle custom boost emoji/count selection callbacks"""
         user_id = callback.from_user.id
         data = callback.data
         
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Custom boost callback: user={user_id}, data={data}")
-        
-        if not hasattr(self, '_custom_boost_selections'):
-            self._custom_boost_selections = {}
+        logger.debug("Custom boost callback: user=%s, data=%s", user_id, data)
         
         # Parse callback data: cbs_<session_id>_<action>_<value>
         # Examples: cbs_1_e_0, cbs_1_done, cbs_1_count_3, cbs_1_back
-        parts = data.split("_")
-        logger.info(f"Parsed parts: {parts}, len={len(parts)}")
+        head, _, rest = data.partition("_")
+        session_part, _, rest = rest.partition("_")
+        action, _, value = rest.partition("_")
+        logger.debug("Parsed: session=%s, action=%s, value=%s", session_part, action, value)
         
-        if len(parts) < 3 or parts[0] != "cbs":
-            logger.warning(f"Invalid callback format: {data}")
+        if head != "cbs" or not session_part.isdigit() or not action:
+            logger.warning("Invalid callback format: %s", data)
             await callback.answer("❌ Noto'g'ri buyruq")
             return
         
-        session_id = int(parts[1])
+        session_id = int(session_part)
         
         # Find session
-        if session_id not in self._custom_boost_selections:
+        selection = self._custom_boost_selections.get(session_id)
+        if selection is None or selection['expires_at'] < time.monotonic():
+            self._custom_boost_selections.pop(session_id, None)
             await callback.answer("❌ Sessiya tugagan. Qaytadan /customboost buyrug'ini ishlating.")
             return
         
-        selection = self._custom_boost_selections[session_id]
-        
         # Verify user owns this session
         if selection['user_id'] != user_id:
             await callback.answer("❌ Bu sizning sessiyangiz emas.")
             return
         
-        action = parts[2]
-        
         # Handle different actions
         if action == "done":
-            logger.info("Done button clicked")
+            logger.debug("Done button clicked")
             # Done selecting emojis, now ask for count
-            if not selection['emojis']:
+            if not selection['emoji_indexes']:
                 await callback.answer("❌ Kamida bitta emoji tanlang!")
                 return
             
             # Show count selection
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-            
             keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [
-                    InlineKeyboardButton(text="1 ta", callback_data=f"cbs_{session_id}_count_1"),
-                    InlineKeyboardButton(text="2 ta", callback_data=f"cbs_{session_id}_count_2"),
-                    InlineKeyboardButton(text="3 ta", callback_data=f"cbs_{session_id}_count_3"),
-                ],
-                [
-                    InlineKeyboardButton(text="4 ta", callback_data=f"cbs_{session_id}_count_4"),
-                    InlineKeyboardButton(text="5 ta", callback_data=f"cbs_{session_id}_count_5"),
-                    InlineKeyboardButton(text="10 ta", callback_data=f"cbs_{session_id}_count_10"),
-                ],
-                [
-                    InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"cbs_{session_id}_back")
-                ]
+                *(
+                    [
+                        InlineKeyboardButton(text=f"{count} ta", callback_data=f"cbs_{session_id}_count_{count}")
+                        for count in row
+                    ]
+                    for row in _BOOST_MULTI_COUNT_ROWS
+                ),
+                [InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"cbs_{session_id}_back")]
             ])
             
-            selected_text = ' '.join(selection['emojis'])
-            
-            await callback.message.edit_text(
-                f"🔢 <b>Nechta reaksiya qo'shilsin?</b>\n\n"
-                f"Post: {selection['post_link']}\n"
-                f"Emojilar: {selected_text}\n\n"
-                f"Har bir emojidan nechta qo'shilsin?",
-                reply_markup=keyboard
+            selected_text = ' '.join(_selected_emojis(selection['emoji_indexes']))
+            
+            await asyncio.gather(
+                callback.message.edit_text(
+                    f"🔢 <b>Nechta reaksiya qo'shilsin?</b>\n\n"
+                    f"Post: {selection['post_link']}\n"
+                    f"Emojilar: {selected_text}\n\n"
+                    f"Har bir emojidan nechta qo'shilsin?",
+                    reply_markup=keyboard
+                ),
+                callback.answer()
             )
-            
-            await callback.answer()
         
         elif action == "count":
-            logger.info("Count button clicked")
+            logger.debug("Count button clicked")
             # Count selected: cbs_1_count_3
-            if len(parts) < 4:
+            if not value:
                 await callback.answer("❌ Noto'g'ri format")
                 return
             
-            count = int(parts[3])
-            logger.info(f"Count: {count}")
+            count = int(value)
+            logger.debug("Count: %d", count)
             
-            # Now boost the post
-            await self._custom_boost_post(callback.message, selection, count)
+            # Now boost the post; acknowledge right away instead of after the boost
+            await asyncio.gather(
+                self._custom_boost_post(callback.message, selection, count),
+                callback.answer()
+            )
             
             # Clear selection
-            del self._custom_boost_selections[session_id]
-            
-            await callback.answer()
+            self._custom_boost_selections.pop(session_id, None)
         
         elif action == "back":
-            logger.info("Back button clicked")
+            logger.debug("Back button clicked")
             # Go back to emoji selection - rebuild the emoji keyboard
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-            
-            emoji_list = selection['emoji_list']
-            
-            keyboard_buttons = []
-            row = []
-            for idx, e in enumerate(emoji_list):
-                # Add checkmark if selected
-                text = f"✅ {e}" if e in selection['emojis'] else e
-                row.append(InlineKeyboardButton(text=text, callback_data=f"cbs_{session_id}_e_{idx}"))
-                if len(row) == 4:
-                    keyboard_buttons.append(row)
-                    row = []
-            if row:
-                keyboard_buttons.append(row)
-            
-            keyboard_buttons.append([
-                InlineKeyboardButton(text="✅ Tayyor (tanlangan emojilar bilan)", callback_data=f"cbs_{session_id}_done")
-            ])
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-            
-            selected_text = ' '.join(selection['emojis']) if selection['emojis'] else 'Hech narsa tanlanmagan'
-            
-            await callback.message.edit_text(
-                f"😊 <b>Emojilarni tanlang</b>\n\n"
-                f"Post: {selection['post_link']}\n\n"
-                f"<b>Tanlangan:</b> {selected_text}\n\n"
-                f"Qaysi emojilarni qo'shmoqchisiz? (bir nechta tanlash mumkin)",
-                reply_markup=keyboard
+            keyboard = _custom_boost_emoji_keyboard(session_id, selection['emoji_indexes'])
+            selection['keyboard'] = keyboard.inline_keyboard
+            
+            await asyncio.gather(
+                callback.message.edit_text(
+                    _MSG_CUSTOM_BOOST_PICK.format(post_link=selection['post_link']),
+                    reply_markup=keyboard
+                ),
+                callback.answer()
             )
-            
-            await callback.answer()
         
         elif action == "e":
-            logger.info("Emoji button clicked")
+            logger.debug("Emoji button clicked")
             # Emoji selection: cbs_1_e_0 (index)
-            if len(parts) < 4:
+            if not value:
                 await callback.answer("❌ Noto'g'ri format")
                 return
             
-            emoji_idx = int(parts[3])
-            emoji = selection['emoji_list'][emoji_idx]
-            logger.info(f"Emoji: {emoji}, index: {emoji_idx}")
+            emoji_idx = int(value)
+            emoji = _REACTION_EMOJIS[emoji_idx]
+            logger.debug("Emoji: %s, index: %s", emoji, emoji_idx)
             
-            if emoji in selection['emojis']:
-                selection['emojis'].remove(emoji)
-                await callback.answer(f"❌ {emoji} olib tashlandi")
+            indexes = selection['emoji_indexes']
+            if emoji_idx in indexes:
+                indexes.discard(emoji_idx)
+                notice = f"❌ {emoji} olib tashlandi"
             else:
-                selection['emojis'].append(emoji)
-                await callback.answer(f"✅ {emoji} qo'shildi")
-            
-            # Update message to show selected emojis
-            selected_text = ' '.join(selection['emojis']) if selection['emojis'] else 'Hech narsa tanlanmagan'
-            
-            # Rebuild keyboard with updated selection
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-            
-            emoji_list = selection['emoji_list']
-            
-            keyboard_buttons = []
-            row = []
-            for idx, e in enumerate(emoji_list):
-                # Add checkmark if selected
-                text = f"✅ {e}" if e in selection['emojis'] else e
-                row.append(InlineKeyboardButton(text=text, callback_data=f"cbs_{session_id}_e_{idx}"))
-                if len(row) == 4:
-                    keyboard_buttons.append(row)
-                    row = []
-            if row:
-                keyboard_buttons.append(row)
-            
-            keyboard_buttons.append([
-                InlineKeyboardButton(text="✅ Tayyor (tanlangan emojilar bilan)", callback_data=f"cbs_{session_id}_done")
-            ])
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-            
-            await callback.message.edit_text(
-                f"😊 <b>Emojilarni tanlang</b>\n\n"
-                f"Post: {selection['post_link']}\n\n"
-                f"<b>Tanlangan:</b> {selected_text}\n\n"
-                f"Qaysi emojilarni qo'shmoqchisiz? (bir nechta tanlash mumkin)",
-                reply_markup=keyboard
+                indexes.add(emoji_idx)
+                notice = f"✅ {emoji} qo'shildi"
+            
+            # Only the toggled button changes; the text stays as it is
+            row, col = divmod(emoji_idx, _EMOJIS_PER_ROW)
+            selection['keyboard'][row][col] = _custom_boost_emoji_button(session_id, emoji_idx, emoji_idx in indexes)
+            
+            await asyncio.gather(
+                callback.message.edit_reply_markup(
+                    reply_markup=InlineKeyboardMarkup(inline_keyboard=selection['keyboard'])
+                ),
+                callback.answer(notice)
             )
         
         else:
-            logger.warning(f"Unknown action: {action}")
+            logger.warning("Unknown action: %s", action)
             await callback.answer("❌ Noto'g'ri buyruq")
     
     async def _custom_boost_post(self, message: Message, selection: dict, count_per_emoji: int) -> None:
         """Boost a post with custom emoji selection - multi-bot support"""
         post_link = selection['post_link']
-        emojis = selection['emojis']
+        emojis = _selected_emojis(selection['emoji_indexes'])
         
-        # Parse link
-        try:
-            link_parts = post_link.split('/')
-            
-            if '/c/' in post_link:
-                channel_id_str = link_parts[-2]
-                post_id = int(link_parts[-1])
-                channel_id = int(f"-100{channel_id_str}")
-            else:
-                username = link_parts[-2]
-                post_id = int(link_parts[-1])
-                
-                try:
-                    chat = await self.bot.get_chat(f"@{username}")
-                    channel_id = chat.id
-                except Exception as e:
-                    await message.reply(f"❌ Kanal topilmadi: @{username}\n\nXatolik: {e}")
-                    return
-        except Exception as e:
-            await message.reply(f"❌ Link noto'g'ri formatda!\n\nXatolik: {e}")
+        resolved = await self._resolve_post_link(message, post_link)
+        if resolved is None:
             return
+        channel_id, post_id = resolved
         
         # Get channel from database
-        session = await self.database.get_session()
         try:
-            from sqlalchemy import select
-            result = await session.execute(
-                select(Channel).where(
-                    Channel.channel_id == channel_id,
-                    Channel.is_active == True
-                )
-            )
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                await message.reply(
-                    f"❌ Kanal topilmadi!\n\n"
-                    f"Kanal ID: <code>{channel_id}</code>\n\n"
-                    f"Avval /fixchannel buyrug'i bilan kanalni qo'shing."
-                )
-                return
-            
-            # Check if we have multiple bot tokens configured
-            reaction_tokens = self.config.REACTION_BOT_TOKENS
-            
-            if not reaction_tokens:
-                # Single bot mode - only last emoji will remain
-                await message.reply(
-                    f"⏳ Reaksiya qo'shilmoqda...\n\n"
-                    f"Kanal: {channel.channel_title}\n"
-                    f"Post ID: {post_id}\n"
-                    f"Tanlangan emojilar: {' '.join(emojis)}\n\n"
-                    f"💡 Eslatma: Bir bot bir postga faqat bitta reaksiya qo'sha oladi.\n"
-                    f"Oxirgi tanlangan emoji qo'shiladi."
-                )
+            async with self.database.session() as session:
+                channel = await self._find_active_channel(session, channel_id)
                 
-                # Add reactions - only last one will remain
-                from ..services.reaction_boost_service import ReactionBoostService
-                import random
-                
-                reaction_service = ReactionBoostService(self.bot, session)
-                failed_emojis = []
-                last_successful_emoji = None
+                if not channel:
+                    await message.reply(
+                        f"❌ Kanal topilmadi!\n\n"
+                        f"Kanal ID: <code>{channel_id}</code>\n\n"
+                        f"Avval /fixchannel buyrug'i bilan kanalni qo'shing."
+                    )
+                    return
                 
-                # Try each emoji - Telegram will replace the previous reaction
-                for emoji in emojis:
-                    try:
-                        await reaction_service._add_reaction_with_retry(
-                            str(channel_id),
-                            post_id,
-                            emoji
-                        )
-                        last_successful_emoji = emoji
-                        
-                        # Small delay before next emoji
-                        if emoji != emojis[-1]:
-                            await asyncio.sleep(random.uniform(0.5, 1))
-                            
-                    except Exception as e:
-                        error_msg = str(e)
-                        if "REACTION_INVALID" in error_msg:
-                            if emoji not in failed_emojis:
-                                failed_emojis.append(emoji)
-                        else:
-                            logger.error(f"Failed to add reaction {emoji}: {e}")
-                            failed_emojis.append(emoji)
+                # Check if we have multiple bot tokens configured
+                reaction_tokens = self.config.REACTION_BOT_TOKENS
                 
-                # Send result
-                result_text = ""
-                if last_successful_emoji:
-                    result_text = f"✅ Reaksiya qo'shildi: {last_successful_emoji}\n\n"
-                    result_text += f"Kanal: {channel.channel_title}\n"
-                    result_text += f"Post ID: {post_id}\n\n"
-                    result_text += f"💡 Bir bot bir postga faqat bitta reaksiya qo'sha oladi.\n"
-                    result_text += f"Oxirgi tanlangan emoji qo'shildi."
+                if not reaction_tokens:
+                    # Single bot mode - only last emoji will remain
+                    await message.reply(
+                        f"⏳ Reaksiya qo'shilmoqda...\n\n"
+                        f"Kanal: {channel.channel_title}\n"
+                        f"Post ID: {post_id}\n"
+                        f"Tanlangan emojilar: {' '.join(emojis)}\n\n"
+                        f"💡 Eslatma: Bir bot bir postga faqat bitta reaksiya qo'sha oladi.\n"
+                        f"Oxirgi tanlangan emoji qo'shiladi."
+                    )
+                    
+                    # Only one reaction per bot survives, so reactions before the
+                    # last would just be replaced: try the last selected emoji and
+                    # walk back only while Telegram rejects them
+                    reaction_service = ReactionBoostService(self.bot, session)
+                    failed_emojis = []
+                    last_successful_emoji = None
+                    
+                    for emoji in reversed(emojis):
+                        try:
+                            await reaction_service._add_reaction_with_retry(
+                                str(channel_id),
+                                post_id,
+                                emoji
+                            )
+                            last_successful_emoji = emoji
+                            break
+                        except Exception as e:
+                            if "REACTION_INVALID" not in str(e):
+                                logger.error("Failed to add reaction %s: %s", emoji, e)
+                            # Keep the failures in selection order
+                            failed_emojis.insert(0, emoji)
+                    
+                    # Send result
+                    if last_successful_emoji:
+                        result_parts = [
+                            f"✅ Reaksiya qo'shildi: {last_successful_emoji}\n\n",
+                            f"Kanal: {channel.channel_title}\n",
+                            f"Post ID: {post_id}\n\n",
+                            "💡 Bir bot bir postga faqat bitta reaksiya qo'sha oladi.\n",
+                            "Oxirgi tanlangan emoji qo'shildi.",
+                        ]
+                    else:
+                        result_parts = ["❌ Hech qanday reaksiya qo'shilmadi"]
+                    
+                    if failed_emojis:
+                        result_parts.append(f"\n\n⚠️ Qo'shilmagan emojilar: {' '.join(failed_emojis)}")
+                    
+                    await message.reply("".join(result_parts))
                 else:
-                    result_text = f"❌ Hech qanday reaksiya qo'shilmadi"
-                
-                if failed_emojis:
-                    result_text += f"\n\n⚠️ Qo'shilmagan emojilar: {' '.join(failed_emojis)}"
-                
-                await message.reply(result_text)
-            else:
-                # Multi-bot mode - each bot adds one reaction
-                await message.reply(
-                    f"⏳ Reaksiya qo'shilmoqda...\n\n"
-                    f"Kanal: {channel.channel_title}\n"
-                    f"Post ID: {post_id}\n"
-                    f"Tanlangan emojilar: {' '.join(emojis)}\n"
-                    f"Botlar soni: {len(reaction_tokens)}\n\n"
-                    f"💡 Har bir bot bitta reaksiya qo'shadi."
-                )
-                
-                # Use main bot + additional bots
-                all_bots = [self.bot]
-                
-                # Create Bot instances for additional tokens
-                for token in reaction_tokens:
-                    try:
-                        additional_bot = Bot(token=token)
-                        all_bots.append(additional_bot)
-                    except Exception as e:
-                        logger.error(f"Failed to create bot with token {token[:10]}...: {e}")
-                
-                successful_emojis = []
-                failed_emojis = []
-                
-                # Add reactions using different bots
-                for i, emoji in enumerate(emojis):
-                    # Use different bot for each emoji (cycle through available bots)
-                    bot_to_use = all_bots[i % len(all_bots)]
+                    # Multi-bot mode - each bot adds one reaction
+                    await message.reply(
+                        f"⏳ Reaksiya qo'shilmoqda...\n\n"
+                        f"Kanal: {channel.channel_title}\n"
+                        f"Post ID: {post_id}\n"
+                        f"Tanlangan emojilar: {' '.join(emojis)}\n"
+                        f"Botlar soni: {len(reaction_tokens)}\n\n"
+                        f"💡 Har bir bot bitta reaksiya qo'shadi."
+                    )
+                    
+                    # Use main bot + additional bots
+                    all_bots = [self.bot]
+                    
+                    # Create Bot instances for additional tokens
+                    for token in reaction_tokens:
+                        try:
+                            additional_bot = Bot(token=token)
+                            all_bots.append(additional_bot)
+                        except Exception as e:
+                            logger.error("Failed to create bot with token %s...: %s", token[:10], e)
+                    
+                    # Emoji i goes to bot i % len(all_bots). Each bot works through
+                    # its own emojis one at a time with a short pause, staying
+                    # under the per-bot flood limit, while different bots run in
+                    # parallel.
+                    added = [False] * len(emojis)
+                    
+                    async def react_with(bot_index: int) -> None:
+                        bot_to_use = all_bots[bot_index]
+                        for i in range(bot_index, len(emojis), len(all_bots)):
+                            if i > bot_index:
+                                await asyncio.sleep(0.5)
+                            emoji = emojis[i]
+                            try:
+                                await bot_to_use.set_message_reaction(
+                                    chat_id=channel_id,
+                                    message_id=post_id,
+                                    reaction=[{"type": "emoji", "emoji": emoji}],
+                                    is_big=False
+                                )
+                                added[i] = True
+                                logger.info("✅ Added reaction %s using bot %d", emoji, bot_index + 1)
+                            except Exception as e:
+                                logger.error("Failed to add reaction %s: %s", emoji, e)
                     
                     try:
-                        await bot_to_use.set_message_reaction(
-                            chat_id=channel_id,
-                            message_id=post_id,
-                            reaction=[{"type": "emoji", "emoji": emoji}],
-                            is_big=False
-                        )
-                        successful_emojis.append(emoji)
-                        logger.info(f"✅ Added reaction {emoji} using bot {i % len(all_bots) + 1}")
-                        
-                        # Small delay between reactions
-                        if i < len(emojis) - 1:
-                            await asyncio.sleep(0.5)
-                            
-                    except Exception as e:
-                        error_msg = str(e)
-                        logger.error(f"Failed to add reaction {emoji}: {e}")
-                        if emoji not in failed_emojis:
-                            failed_emojis.append(emoji)
-                
-                # Send result
-                result_text = ""
-                if successful_emojis:
-                    result_text = f"✅ Reaksiyalar qo'shildi: {' '.join(successful_emojis)}\n\n"
-                    result_text += f"Kanal: {channel.channel_title}\n"
-                    result_text += f"Post ID: {post_id}\n"
-                    result_text += f"Jami: {len(successful_emojis)} ta reaksiya"
-                else:
-                    result_text = f"❌ Hech qanday reaksiya qo'shilmadi"
-                
-                if failed_emojis:
-                    result_text += f"\n\n⚠️ Qo'shilmagan emojilar: {' '.join(failed_emojis)}"
+                        async with asyncio.TaskGroup() as tg:
+                            for bot_index in range(min(len(all_bots), len(emojis))):
+                                tg.create_task(react_with(bot_index))
+                    finally:
+                        # The extra Bot instances are per-call; release their HTTP sessions
+                        for additional_bot in all_bots[1:]:
+                            await additional_bot.session.close()
+                    
+                    successful_emojis = [emoji for emoji, ok in zip(emojis, added) if ok]
+                    failed_emojis = [emoji for emoji, ok in zip(emojis, added) if not ok]
+                    
+                    # Send result
+                    if successful_emojis:
+                        result_parts = [
+                            f"✅ Reaksiyalar qo'shildi: {' '.join(successful_emojis)}\n\n",
+                            f"Kanal: {channel.channel_title}\n",
+                            f"Post ID: {post_id}\n",
+                            f"Jami: {len(successful_emojis)} ta reaksiya",
+                        ]
+                    else:
+                        result_parts = ["❌ Hech qanday reaksiya qo'shilmadi"]
+                    
+                    if failed_emojis:
+                        result_parts.append(f"\n\n⚠️ Qo'shilmagan emojilar: {' '.join(failed_emojis)}")
+                    
+                    await message.reply("".join(result_parts))
                 
-                await message.reply(result_text)
-            
         except Exception as e:
             await message.reply(f"❌ Xatolik: {str(e)}")
-            import logging
-            logging.error(f"Error in custom boost: {e}", exc_info=True)
-        finally:
-            await session.close()
+            logger.error("Error in custom boost: %s", e, exc_info=True)
     
     async def handle_callback_query(self, callback: CallbackQuery) -> None:
         """Handle callback queries from inline keyboards"""
-        user_id = callback.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await callback.answer("❌ Sizda admin huquqlari yo'q.")
+        if not self._is_admin(callback.from_user.id):
+            await callback.answer(_MSG_NOT_ADMIN)
             return
         
         data = callback.data
+        message = callback.message
+        answer = callback.answer
         
-        if data == "main_menu":
-            await self._show_main_menu(callback.message, edit=True)
-        elif data == "show_channels":
-            await self._show_channels(callback.message, edit=True)
-        elif data == "add_channel":
-            await self._show_add_channel_help(callback.message, edit=True)
-        elif data == "show_stats":
-            await self._show_statistics(callback.message, edit=True)
-        elif data == "show_settings":
-            await self._show_settings_menu(callback.message, edit=True)
-        elif data.startswith("channel_"):
-            channel_id = int(data.split("_")[1])
-            await self._show_channel_details(callback.message, channel_id, edit=True)
-        elif data.startswith("toggle_ai_"):
-            channel_id = int(data.split("_")[2])
-            await self._toggle_ai(callback.message, channel_id)
-        elif data.startswith("reaction_settings_"):
-            channel_id = int(data.split("_")[2])
-            await self._show_reaction_settings(callback.message, channel_id, edit=True)
-        elif data.startswith("enable_reaction_"):
-            channel_id = int(data.split("_")[2])
-            await self._enable_reaction_mode(callback.message, channel_id)
-        elif data.startswith("set_emojis_"):
-            channel_id = int(data.split("_")[2])
-            await self._prompt_set_emojis(callback.message, channel_id, edit=True)
-        elif data.startswith("set_count_"):
-            channel_id = int(data.split("_")[2])
-            await self._prompt_set_count(callback.message, channel_id, edit=True)
-        elif data.startswith("toggle_auto_"):
-            channel_id = int(data.split("_")[2])
-            await self._toggle_auto_boost(callback.message, channel_id)
-        elif data.startswith("emoji_"):
-            parts = data.split("_")
-            channel_id = int(parts[1])
-            emoji = parts[2]
-            await self._add_emoji(callback.message, channel_id, emoji)
-        elif data.startswith("count_"):
-            parts = data.split("_")
-            channel_id = int(parts[1])
-            count = int(parts[2])
-            await self._set_reaction_count(callback.message, channel_id, count)
-        elif data.startswith("bm_"):
-            # Format: bm_c_<channel_id>_<post_id>_<count> or bm_u_<username>_<post_id>_<count>
-            parts = data.split("_")
-            if len(parts) >= 5:
-                link_type = parts[1]  # 'c' or 'u'
-                if link_type == 'c':
-                    # Private channel: bm_c_1234567890_123_5
-                    channel_part = parts[2]
-                    post_id = parts[3]
-                    count = int(parts[4])
-                    post_link = f"https://t.me/c/{channel_part}/{post_id}"
-                elif link_type == 'u':
-                    # Public channel: bm_u_username_123_5
-                    username = parts[2]
-                    post_id = parts[3]
-                    count = int(parts[4])
-                    post_link = f"https://t.me/{username}/{post_id}"
-                else:
-                    return
-                
-                await self._boost_post_multiple_times(callback.message, post_link, count)
-        elif data.startswith("cbs_"):
-            # Custom boost callbacks (session-based)
+        head, _, args = data.partition("_")
+        if head == "cbs":
+            # Custom boost callbacks (session-based) answer the query themselves
             await self._handle_custom_boost_callback(callback)
-            return  # Don't call callback.answer() again since it's handled in the method
+            return
         
-        await callback.answer()
-    
-    async def _show_main_menu(self, message: Message, edit: bool = False) -> None:
-        """Show main admin menu"""
-        text = (
-            "🤖 <b>Telegram AI Bot - Admin Panel</b>\n\n"
-            "Botni boshqarish uchun quyidagi tugmalardan foydalaning:"
-        )
+        handler = None
+        route = self._menu_routes.get(data)
+        if route is not None:
+            handler = route(message, edit=True)
+        else:
+            verb, _, tail = data.rpartition("_")
+            route = self._channel_routes.get(verb)
+            if route is not None and tail.isdigit():
+                handler = route(message, int(tail))
+            else:
+                route = self._prefix_routes.get(head)
+                if route is not None:
+                    handler = route(message, args)
         
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="📊 Statistika", callback_data="show_stats")],
-            [InlineKeyboardButton(text="📢 Kanallar", callback_data="show_channels")],
-            [InlineKeyboardButton(text="➕ Kanal qo'shish", callback_data="add_channel")],
-            [InlineKeyboardButton(text="⚙️ Sozlamalar", callback_data="show_settings")]
-        ])
+        if handler is None:
+            await answer()
+            return
         
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
+        # The acknowledgement does not depend on the handler's edits, so both
+        # Telegram round-trips are issued concurrently
+        await asyncio.gather(handler, answer())
+    
+    def _route_emoji(self, message: Message, args: str) -> Optional[Awaitable[None]]:
+        """Route emoji_<channel_id>_<index> callbacks, index into _REACTION_EMOJIS"""
+        channel_part, _, index_part = args.partition("_")
+        if not index_part.isdigit() or int(index_part) >= len(_REACTION_EMOJIS):
+            return None
+        return self._add_emoji(message, int(channel_part), _REACTION_EMOJIS[int(index_part)])
+    
+    def _route_count(self, message: Message, args: str) -> Optional[Awaitable[None]]:
+        """Route count_<channel_id>_<count> callbacks"""
+        channel_part, _, count_part = args.partition("_")
+        return self._set_reaction_count(message, int(channel_part), int(count_part))
+    
+    def _route_boost_multi(self, message: Message, args: str) -> Optional[Awaitable[None]]:
+        """Route bm_c_<channel_id>_<post_id>_<count> and bm_u_<username>_<post_id>_<count> callbacks"""
+        link_type, _, rest = args.partition("_")  # 'c' or 'u'
+        # Split from the right so usernames containing underscores stay intact
+        parts = rest.rsplit("_", 2)
+        if len(parts) < 3:
+            return None
+        
+        ident, post_id, count = parts
+        if link_type == 'c':
+            # Private channel: bm_c_1234567890_123_5
+            post_link = f"https://t.me/c/{ident}/{post_id}"
+        elif link_type == 'u':
+            # Public channel: bm_u_username_123_5
+            post_link = f"https://t.me/{ident}/{post_id}"
         else:
-            await message.reply(text, reply_markup=keyboard)
+            return None
+        
+        return self._boost_post_multiple_times(message, post_link, int(count))
     
-    async def _show_channels(self, message: Message, edit: bool = False) -> None:
-        """Show list of configured channels"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.is_active == True))
-            channels = result.scalars().all()
-        finally:
-            await session.close()
+    async def _send_view(
+        self,
+        message: Message,
+        text: str,
+        keyboard: InlineKeyboardMarkup,
+        edit: bool = False
+    ) -> None:
+        """Edit the message in place or reply with a new one
+        
+        Edits that would leave the message unchanged are skipped; Telegram
+        rejects them with "message is not modified" anyway, and that error is
+        swallowed for renders the cache no longer remembers.
+        """
+        if not (edit and message):
+            await message.reply(text, reply_markup=keyboard)
+            return
         
-        if not channels:
-            text = (
-                "📢 <b>Kanallar</b>\n\n"
-                "Hozircha hech qanday kanal ulanmagan.\n"
-                "Kanal qo'shish uchun 'Kanal qo'shish' tugmasini bosing."
-            )
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
+        key = (message.chat.id, message.message_id)
+        digest = hash((
+            text,
+            tuple((button.text, button.callback_data) for row in keyboard.inline_keyboard for button in row)
+        ))
+        if self._last_render.get(key) == digest:
+            return
+        
+        try:
+            await message.edit_text(text, reply_markup=keyboard)
+        except TelegramBadRequest as e:
+            if "message is not modified" not in str(e):
+                raise
+        
+        self._last_render.pop(key, None)
+        self._last_render[key] = digest
+        if len(self._last_render) > RENDER_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest render
+            del self._last_render[next(iter(self._last_render))]
+    
+    async def _show_main_menu(self, message: Message, edit: bool = False) -> None:
+        """Show main admin menu"""
+        await self._send_view(message, _MSG_MAIN_MENU, _MAIN_MENU_KB, edit)
+    
+    async def _show_channels(self, message: Message, edit: bool = False, after_id: int = 0) -> None:
+        """Show list of configured channels, one message-sized page at a time"""
+        page = None
+        if after_id == 0 and time.monotonic() - self._channels_cache_ts < CHANNELS_CACHE_TTL:
+            page = self._channels_cache
+        
+        if page is None:
+            page = await self._load_channels_page(after_id)
+            if after_id == 0:
+                self._channels_cache = page
+                self._channels_cache_ts = time.monotonic()
+        
+        parts, keyboard_buttons, next_after_id = page
+        
+        if not parts:
+            text = _MSG_NO_CHANNELS
+            keyboard = _NO_CHANNELS_KB
+        else:
+            text = "".join(("📢 <b>Ulangan kanallar:</b>\n\n", *parts))
+            keyboard_buttons = list(keyboard_buttons)
+            if next_after_id is not None:
+                keyboard_buttons.append([
+                    InlineKeyboardButton(text="Keyingi sahifa ➡️", callback_data=f"show_channels_page_{next_after_id}")
+                ])
+            keyboard_buttons.extend([
                 [InlineKeyboardButton(text="➕ Kanal qo'shish", callback_data="add_channel")],
                 [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
             ])
-        else:
-            text = "📢 <b>Ulangan kanallar:</b>\n\n"
-            keyboard_buttons = []
             
-            for channel in channels:
-                status = "🟢" if channel.ai_enabled else "🔴"
-                text += f"{status} {channel.channel_title}\n"
-                text += f"   ID: <code>{channel.channel_id}</code>\n"
-                ai_text = 'Yoqilgan' if channel.ai_enabled else 'Ochirilgan'
-                text += f"   AI: {ai_text}\n\n"
+            keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+        
+        await self._send_view(message, text, keyboard, edit)
+    
+    async def _load_channels_page(self, after_id: int) -> _ChannelsPage:
+        """Stream active channels with id > after_id until a page of text is full
+        
+        Returns the text fragments, channel buttons and the id to continue
+        after, or None when this is the last page.
+        """
+        parts: list[str] = []
+        keyboard_buttons: list[list[InlineKeyboardButton]] = []
+        page_chars = 0
+        last_id = None
+        
+        async with self.database.session() as session:
+            result = await session.stream(_STMT_CHANNELS_PAGE, {"after_id": after_id})
+            async for channel in result:
+                ai_enabled = bool(channel.ai_enabled)
+                status = _AI_ICON[ai_enabled]
+                ai_text = _AI_LIST_STATUS[ai_enabled]
+                part = (
+                    f"{status} {channel.channel_title}\n"
+                    f"   ID: <code>{channel.channel_id}</code>\n"
+                    f"   AI: {ai_text}\n\n"
+                )
+                
+                if parts and page_chars + len(part) > CHANNELS_PAGE_CHARS:
+                    await result.close()
+                    return parts, keyboard_buttons, last_id
                 
+                parts.append(part)
+                page_chars += len(part)
+                last_id = channel.id
                 keyboard_buttons.append([
                     InlineKeyboardButton(
                         text=f"⚙️ {channel.channel_title[:20]}...",
                         callback_data=f"channel_{channel.id}"
                     )
                 ])
-            
-            keyboard_buttons.extend([
-                [InlineKeyboardButton(text="➕ Kanal qo'shish", callback_data="add_channel")],
-                [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
-            ])
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
         
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
-        else:
-            await message.reply(text, reply_markup=keyboard)
+        return parts, keyboard_buttons, None
     
     async def _show_add_channel_help(self, message: Message, edit: bool = False) -> None:
         """Show instructions for adding a channel"""
-        text = (
-            "➕ <b>Kanal qo'shish</b>\n\n"
-            "<b>Qadamlar:</b>\n"
-            "1. Botni kanalingizga admin qilib qo'shing\n"
-            "2. Kanal uchun discussion group yarating\n"
-            "3. Botni discussion groupga ham qo'shing\n"
-            "4. Discussion groupda /setup buyrug'ini yuboring\n\n"
-            "<b>Eslatma:</b> Bot faqat discussion group xabarlarini kuzatadi."
-        )
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="🔙 Orqaga", callback_data="show_channels")]
-        ])
-        
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
-        else:
-            await message.reply(text, reply_markup=keyboard)
+        await self._send_view(message, _MSG_ADD_HELP, _ADD_HELP_KB, edit)
     
     async def _show_statistics(self, message: Message, edit: bool = False) -> None:
         """Show bot statistics"""
-        session = await self.database.get_session()
-        try:
-            # Get today's stats
-            today = datetime.now().date()
-            yesterday = today - timedelta(days=1)
-            week_ago = today - timedelta(days=7)
-            
-            # Today's responses
-            today_responses = await session.execute(
-                select(func.count(Response.id))
-                .where(func.date(Response.created_at) == today)
-            )
-            today_count = today_responses.scalar() or 0
-            
-            # Yesterday's responses
-            yesterday_responses = await session.execute(
-                select(func.count(Response.id))
-                .where(func.date(Response.created_at) == yesterday)
-            )
-            yesterday_count = yesterday_responses.scalar() or 0
-            
-            # This week's responses
-            week_responses = await session.execute(
-                select(func.count(Response.id))
-                .where(func.date(Response.created_at) >= week_ago)
-            )
-            week_count = week_responses.scalar() or 0
-            
-            # Total channels
-            total_channels = await session.execute(
-                select(func.count(Channel.id)).where(Channel.is_active == True)
+        async with self.database.session() as session:
+            # Local day boundaries, computed once and made timezone-aware to
+            # match the timestamptz created_at column
+            today_start = datetime.combine(datetime.now().date(), datetime.min.time()).astimezone()
+            tomorrow_start = today_start + timedelta(days=1)
+            yesterday_start = today_start - timedelta(days=1)
+            week_start = today_start - timedelta(days=7)
+            
+            # Today, yesterday and week counts in a single pass over responses,
+            # plus the active channel count, in one round trip; half-open
+            # ranges on the bare column keep idx_responses_created_at usable
+            created_at = Response.created_at
+            active_channels = (
+                select(func.count())
+                .select_from(Channel)
+                .where(Channel.is_active.is_(True))
+                .scalar_subquery()
             )
-            channels_count = total_channels.scalar() or 0
-        finally:
-            await session.close()
+            today_count, yesterday_count, week_count, channels_count = (await session.execute(
+                select(
+                    func.count().filter(created_at >= today_start, created_at < tomorrow_start),
+                    func.count().filter(created_at >= yesterday_start, created_at < today_start),
+                    func.count(),
+                    active_channels,
+                ).select_from(Response).where(created_at >= week_start)
+            )).one()
         
         text = (
             "📊 <b>Bot Statistikasi</b>\n\n"
@@ -1140,15 +1393,7 @@ class AdminHandler:
             f"🕐 <b>Oxirgi yangilanish:</b> {datetime.now().strftime('%H:%M')}"
         )
         
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="🔄 Yangilash", callback_data="show_stats")],
-            [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
-        ])
-        
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
-        else:
-            await message.reply(text, reply_markup=keyboard)
+        await self._send_view(message, text, _STATS_KB, edit)
     
     async def _show_settings_menu(self, message: Message, edit: bool = False) -> None:
         """Show settings menu"""
@@ -1160,167 +1405,148 @@ class AdminHandler:
             f"📊 <b>Kunlik limit:</b> {self.config.DAILY_RESPONSE_LIMIT}\n"
         )
         
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="🔙 Orqaga", callback_data="main_menu")]
-        ])
+        keyboard = _SETTINGS_KB
         
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
+        await self._send_view(message, text, keyboard, edit)
+    
+    async def _show_channel_details(
+        self,
+        message: Message,
+        channel_id: int,
+        edit: bool = False,
+        session: Optional[AsyncSession] = None
+    ) -> None:
+        """Show detailed channel information
+        
+        When called from inside an open transaction the caller's session is
+        reused instead of going through the channel cache.
+        """
+        if session is not None:
+            channel = await session.get(Channel, channel_id)
         else:
-            await message.reply(text, reply_markup=keyboard)
+            channel = await self._get_channel(channel_id)
+        
+        if not channel:
+            await message.reply("❌ Kanal topilmadi.")
+            return
+        
+        await self._render_channel_details(message, channel, edit=edit)
     
-    async def _show_channel_details(self, message: Message, channel_id: int, edit: bool = False) -> None:
-        """Show detailed channel information"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                await message.reply("❌ Kanal topilmadi.")
-                return
-            
-            ai_status = "🟢 Yoqilgan" if channel.ai_enabled else "🔴 O'chirilgan"
-            mode_text = {
-                'comment': 'Faqat komentlarga javob',
-                'reaction': 'Faqat reaksiya qoshish',
-                'both': 'Ikkalasi ham'
-            }.get(channel.mode, 'Komentlarga javob')
-            
-            text = (
-                f"📢 <b>{channel.channel_title}</b>\n\n"
-                f"🆔 <b>ID:</b> <code>{channel.channel_id}</code>\n"
-                f"💬 <b>Discussion Group:</b> <code>{channel.discussion_group_id or 'Yoq'}</code>\n"
-                f"🔧 <b>Rejim:</b> {mode_text}\n"
-                f"🤖 <b>AI:</b> {ai_status}\n"
-                f"🔧 <b>Provider:</b> {channel.ai_provider}\n"
-                f"📊 <b>Kunlik limit:</b> {channel.daily_limit}\n"
-                f"⏱ <b>Rate limit:</b> {channel.rate_limit_minutes} daqiqa\n"
-                f"📝 <b>Trigger so'zlar:</b> {len(channel.trigger_words)} ta\n"
-            )
-            
-            # Add reaction settings if mode includes reaction
-            if channel.mode in ['reaction', 'both'] and channel.reaction_settings:
-                settings = channel.reaction_settings
-                emojis = settings.get('emojis', [])
-                text += f"\n❤️ <b>Reaksiya sozlamalari:</b>\n"
-                text += f"   • Emojilar: {' '.join(emojis[:5])}\n"
-                text += f"   • Soni: {settings.get('reaction_count', 0)} ta\n"
-                text += f"   • Kutish: {settings.get('delay_min', 0)}-{settings.get('delay_max', 0)}s\n"
-                auto_icon = 'ON' if settings.get('auto_boost') else 'OFF'
-                text += f"   • Auto: {auto_icon}\n"
-            
-            keyboard_buttons = [
-                [InlineKeyboardButton(
-                    text="AI Ochirish" if channel.ai_enabled else "AI Yoqish",
-                    callback_data=f"toggle_ai_{channel.id}"
-                )]
-            ]
-            
-            # Add reaction settings button
-            if channel.mode in ['reaction', 'both']:
-                keyboard_buttons.append([
-                    InlineKeyboardButton(
-                        text="❤️ Reaksiya sozlamalari",
-                        callback_data=f"reaction_settings_{channel.id}"
-                    )
-                ])
-            else:
-                keyboard_buttons.append([
-                    InlineKeyboardButton(
-                        text="❤️ Reaksiya rejimini yoqish",
-                        callback_data=f"enable_reaction_{channel.id}"
-                    )
-                ])
-            
-            keyboard_buttons.append([
-                InlineKeyboardButton(text="🔙 Orqaga", callback_data="show_channels")
-            ])
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-            
-            if edit and message:
-                await message.edit_text(text, reply_markup=keyboard)
-            else:
-                await message.reply(text, reply_markup=keyboard)
-        finally:
-            await session.close()
+    async def _render_channel_details(self, message: Message, channel: Channel, edit: bool = False) -> None:
+        """Render detailed information for an already loaded channel"""
+        ai_status = _AI_STATUS[bool(channel.ai_enabled)]
+        mode_text = _MODE_TEXT.get(channel.mode, _MODE_TEXT_DEFAULT)
+        
+        text = (
+            f"📢 <b>{channel.channel_title}</b>\n\n"
+            f"🆔 <b>ID:</b> <code>{channel.channel_id}</code>\n"
+            f"💬 <b>Discussion Group:</b> <code>{channel.discussion_group_id or 'Yoq'}</code>\n"
+            f"🔧 <b>Rejim:</b> {mode_text}\n"
+            f"🤖 <b>AI:</b> {ai_status}\n"
+            f"🔧 <b>Provider:</b> {channel.ai_provider}\n"
+            f"📊 <b>Kunlik limit:</b> {channel.daily_limit}\n"
+            f"⏱ <b>Rate limit:</b> {channel.rate_limit_minutes} daqiqa\n"
+            f"📝 <b>Trigger so'zlar:</b> {len(channel.trigger_words)} ta\n"
+        )
+        
+        # Add reaction settings if mode includes reaction
+        if channel.mode in ['reaction', 'both'] and channel.reaction_settings:
+            settings = channel.reaction_settings
+            emojis = settings.get('emojis', [])
+            auto_icon = 'ON' if settings.get('auto_boost') else 'OFF'
+            text = "".join((
+                text,
+                f"\n❤️ <b>Reaksiya sozlamalari:</b>\n",
+                f"   • Emojilar: {' '.join(emojis[:5])}\n",
+                f"   • Soni: {settings.get('reaction_count', 0)} ta\n",
+                f"   • Kutish: {settings.get('delay_min', 0)}-{settings.get('delay_max', 0)}s\n",
+                f"   • Auto: {auto_icon}\n",
+            ))
+        
+        keyboard = _channel_details_keyboard(
+            channel.id,
+            bool(channel.ai_enabled),
+            channel.mode in ('reaction', 'both')
+        )
+        
+        await self._send_view(message, text, keyboard, edit)
     
     async def _toggle_ai(self, message: Message, channel_id: int) -> None:
         """Toggle AI for a channel"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
+        async with self.database.session() as session:
+            # Flip the flag in a single UPDATE so simultaneous clicks cannot race
+            channel = await session.scalar(
+                update(Channel)
+                .where(Channel.id == channel_id)
+                .values(ai_enabled=not_(Channel.ai_enabled))
+                .returning(Channel)
+            )
             
             if not channel:
                 await message.reply("❌ Kanal topilmadi.")
                 return
             
-            channel.ai_enabled = not channel.ai_enabled
             await session.commit()
+            self._invalidate_channels()
             
-            status = "yoqildi" if channel.ai_enabled else "ochirildi"
+            status = _AI_TOGGLED[bool(channel.ai_enabled)]
             await message.reply(f"✅ {channel.channel_title} uchun AI {status}.")
             
-            # Refresh channel details
-            await self._show_channel_details(message, channel_id, edit=True)
-        finally:
-            await session.close()
+            # Refresh channel details from the returned row
+            await self._render_channel_details(message, channel, edit=True)
 
     
-    async def _show_reaction_settings(self, message: Message, channel_id: int, edit: bool = False) -> None:
-        """Show reaction settings for a channel"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                await message.reply("❌ Kanal topilmadi.")
-                return
-            
-            settings = channel.reaction_settings or {}
-            emojis = settings.get('emojis', [])
-            count = settings.get('reaction_count', 3)
-            delay_min = settings.get('delay_min', 2.0)
-            delay_max = settings.get('delay_max', 8.0)
-            auto_boost = settings.get('auto_boost', True)
-            
-            auto_status = "Yoqilgan" if auto_boost else "O'chirilgan"
-            
-            text = (
-                f"❤️ <b>Reaksiya sozlamalari</b>\n"
-                f"📢 <b>Kanal:</b> {channel.channel_title}\n\n"
-                f"😊 <b>Emojilar:</b> {' '.join(emojis) if emojis else 'Tanlanmagan'}\n"
-                f"🔢 <b>Har postga:</b> {count} ta reaksiya\n"
-                f"⏱ <b>Kutish vaqti:</b> {delay_min}-{delay_max} soniya\n"
-                f"🤖 <b>Auto-boost:</b> {auto_status}\n"
-            )
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(text="😊 Emojilarni o'zgartirish", callback_data=f"set_emojis_{channel_id}")],
-                [InlineKeyboardButton(text="🔢 Sonini o'zgartirish", callback_data=f"set_count_{channel_id}")],
-                [InlineKeyboardButton(
-                    text="Auto-boost O'chirish" if auto_boost else "Auto-boost Yoqish",
-                    callback_data=f"toggle_auto_{channel_id}"
-                )],
-                [InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"channel_{channel_id}")]
-            ])
-            
-            if edit and message:
-                await message.edit_text(text, reply_markup=keyboard)
-            else:
-                await message.reply(text, reply_markup=keyboard)
-        finally:
-            await session.close()
+    async def _show_reaction_settings(
+        self,
+        message: Message,
+        channel_id: int,
+        edit: bool = False,
+        session: Optional[AsyncSession] = None
+    ) -> None:
+        """Show reaction settings for a channel
+        
+        When called from inside an open transaction the caller's session is
+        reused instead of going through the channel cache.
+        """
+        if session is not None:
+            channel = await session.get(Channel, channel_id)
+        else:
+            channel = await self._get_channel(channel_id)
+        
+        if not channel:
+            await message.reply("❌ Kanal topilmadi.")
+            return
+        
+        await self._render_reaction_settings(message, channel, edit=edit)
+    
+    async def _render_reaction_settings(self, message: Message, channel: Channel, edit: bool = False) -> None:
+        """Render reaction settings for an already loaded channel"""
+        settings = channel.reaction_settings or {}
+        emojis = settings.get('emojis', [])
+        count = settings.get('reaction_count', 3)
+        delay_min = settings.get('delay_min', 2.0)
+        delay_max = settings.get('delay_max', 8.0)
+        auto_boost = settings.get('auto_boost', True)
+        
+        auto_status = _AUTO_STATUS[bool(auto_boost)]
+        
+        text = (
+            f"❤️ <b>Reaksiya sozlamalari</b>\n"
+            f"📢 <b>Kanal:</b> {channel.channel_title}\n\n"
+            f"😊 <b>Emojilar:</b> {' '.join(emojis) if emojis else 'Tanlanmagan'}\n"
+            f"🔢 <b>Har postga:</b> {count} ta reaksiya\n"
+            f"⏱ <b>Kutish vaqti:</b> {delay_min}-{delay_max} soniya\n"
+            f"🤖 <b>Auto-boost:</b> {auto_status}\n"
+        )
+        
+        keyboard = _reaction_settings_keyboard(channel.id, bool(auto_boost))
+        
+        await self._send_view(message, text, keyboard, edit)
     
     async def _enable_reaction_mode(self, message: Message, channel_id: int) -> None:
         """Enable reaction mode for a channel"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
+        async with self.database.session() as session:
+            channel = await session.get(Channel, channel_id)
             
             if not channel:
                 return
@@ -1328,7 +1554,7 @@ class AdminHandler:
             # Set default reaction settings
             channel.mode = 'both' if channel.mode == 'comment' else 'reaction'
             channel.reaction_settings = {
-                'emojis': ['👍', '❤️', '🔥', '😍', '🎉'],
+                'emojis': list(_INITIAL_BOOST_EMOJIS),
                 'reaction_count': 3,
                 'delay_min': 2.0,
                 'delay_max': 8.0,
@@ -1336,145 +1562,158 @@ class AdminHandler:
             }
             
             await session.commit()
-            await self._show_channel_details(message, channel_id, edit=True)
-        finally:
-            await session.close()
+            self._invalidate_channels()
+            await self._render_channel_details(message, channel, edit=True)
     
     async def _prompt_set_emojis(self, message: Message, channel_id: int, edit: bool = False) -> None:
         """Prompt user to set emojis"""
-        text = (
-            "😊 <b>Emojilarni tanlang</b>\n\n"
-            "Quyidagi emojilardan tanlang (tugmani bosing):\n"
-        )
-        
-        # Popular emojis - only valid Telegram reaction emojis
-        emojis = [
-            '👍', '👎', '❤️', '🔥', '🥰', '👏', '😁', '🤔', '🤯', '😱',
-            '🤬', '😢', '🎉', '🤩', '🤮', '💩', '🙏', '👌', '🕊', '🤡'
-        ]
-        
-        keyboard_buttons = []
-        row = []
-        for i, emoji in enumerate(emojis):
-            row.append(InlineKeyboardButton(text=emoji, callback_data=f"emoji_{channel_id}_{emoji}"))
-            if len(row) == 4:
-                keyboard_buttons.append(row)
-                row = []
-        if row:
-            keyboard_buttons.append(row)
-        
-        keyboard_buttons.append([
-            InlineKeyboardButton(text="✅ Tayyor", callback_data=f"reaction_settings_{channel_id}")
-        ])
-        keyboard_buttons.append([
-            InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"reaction_settings_{channel_id}")
-        ])
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-        
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
-        else:
-            await message.reply(text, reply_markup=keyboard)
+        await self._send_view(message, _MSG_PICK_EMOJIS, _emoji_keyboard(channel_id), edit)
     
     async def _prompt_set_count(self, message: Message, channel_id: int, edit: bool = False) -> None:
         """Prompt user to set reaction count"""
-        text = (
-            "🔢 <b>Reaksiya sonini tanlang</b>\n\n"
-            "Har bir postga nechta reaksiya qo'shilsin?"
-        )
-        
-        keyboard_buttons = []
-        for count in [1, 2, 3, 4, 5]:
-            keyboard_buttons.append([
-                InlineKeyboardButton(text=f"{count} ta", callback_data=f"count_{channel_id}_{count}")
-            ])
-        
-        keyboard_buttons.append([
-            InlineKeyboardButton(text="🔙 Orqaga", callback_data=f"reaction_settings_{channel_id}")
-        ])
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-        
-        if edit and message:
-            await message.edit_text(text, reply_markup=keyboard)
-        else:
-            await message.reply(text, reply_markup=keyboard)
+        await self._send_view(message, _MSG_PICK_COUNT, _count_keyboard(channel_id), edit)
     
     async def _toggle_auto_boost(self, message: Message, channel_id: int) -> None:
         """Toggle auto-boost for a channel"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
+        async with self.database.session() as session:
+            channel = await self._update_reaction_setting(
+                session, channel_id, 'auto_boost',
+                pg_value=not_(func.coalesce(Channel.reaction_settings['auto_boost'].as_boolean(), true())),
+                py_value=lambda settings: not settings.get('auto_boost', True)
+            )
             
-            if not channel or not channel.reaction_settings:
+            if not channel:
                 return
             
-            settings = channel.reaction_settings
-            settings['auto_boost'] = not settings.get('auto_boost', True)
-            channel.reaction_settings = settings
-            
             await session.commit()
-            await self._show_reaction_settings(message, channel_id, edit=True)
-        finally:
-            await session.close()
+            self._invalidate_channels()
+            await self._render_reaction_settings(message, channel, edit=True)
 
     
+    async def _update_reaction_setting(
+        self,
+        session: AsyncSession,
+        channel_id: int,
+        key: str,
+        pg_value: Any,
+        py_value: Callable[[dict], Any]
+    ) -> Optional[Channel]:
+        """Set a single reaction_settings key and return the updated channel
+        
+        On PostgreSQL the key is rewritten in place with jsonb_set in one
+        UPDATE ... RETURNING; other dialects load the row and assign a new dict.
+        Channels without reaction settings are left untouched.
+        """
+        if session.bind.dialect.name == "postgresql":
+            new_settings = func.jsonb_set(
+                cast(Channel.reaction_settings, JSONB),
+                literal([key], ARRAY(Text)),
+                func.to_jsonb(pg_value)
+            )
+            return await session.scalar(
+                update(Channel)
+                .where(Channel.id == channel_id, Channel.reaction_settings.isnot(None))
+                .values(reaction_settings=cast(new_settings, JSON))
+                .returning(Channel)
+            )
+        
+        channel = await session.get(Channel, channel_id)
+        if not channel or not channel.reaction_settings:
+            return None
+        
+        # MutableDict tracks the key assignment, no need to rebuild the dict
+        settings = channel.reaction_settings
+        settings[key] = py_value(settings)
+        return channel
+    
     async def _add_emoji(self, message: Message, channel_id: int, emoji: str) -> None:
-        """Add or remove emoji from reaction settings"""
-        session = await self.database.get_session()
+        """Stage an emoji toggle; bursts of taps are flushed in one write"""
+        dirty = self._emoji_dirty.setdefault(channel_id, set())
+        
+        # Tapping the same emoji twice within the window cancels out
+        if emoji in dirty:
+            dirty.remove(emoji)
+        else:
+            dirty.add(emoji)
+        
+        if channel_id not in self._emoji_pending:
+            self._emoji_pending[channel_id] = asyncio.create_task(self._flush_emoji(message, channel_id))
+    
+    async def _flush_emoji(self, message: Message, channel_id: int) -> None:
+        """Apply staged emoji toggles for a channel until no new taps arrive
+        
+        Taps landing while a batch is being written stay in _emoji_dirty and
+        go out with the next pass of this same task, so writes for one
+        channel never overlap.
+        """
         try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                return
-            
-            settings = channel.reaction_settings or {
-                'emojis': [],
-                'reaction_count': 3,
-                'delay_min': 2.0,
-                'delay_max': 8.0,
-                'auto_boost': True
-            }
-            
-            emojis = settings.get('emojis', [])
-            
-            if emoji in emojis:
-                emojis.remove(emoji)
-            else:
-                emojis.append(emoji)
-            
-            settings['emojis'] = emojis
-            channel.reaction_settings = settings
-            
-            await session.commit()
-            
-            # Refresh the emoji selection screen
-            try:
-                await self._prompt_set_emojis(message, channel_id, edit=True)
-            except Exception:
-                # If edit fails, send new message
-                await self._prompt_set_emojis(message, channel_id, edit=False)
+            while True:
+                await asyncio.sleep(EMOJI_FLUSH_DELAY)
+                toggled = self._emoji_dirty.pop(channel_id, None)
+                
+                if not toggled:
+                    return
+                
+                await self._save_emoji_toggles(message, channel_id, toggled)
         finally:
-            await session.close()
+            self._emoji_pending.pop(channel_id, None)
+    
+    async def _save_emoji_toggles(self, message: Message, channel_id: int, toggled: AbstractSet[str]) -> None:
+        """Write one batch of emoji toggles and refresh the screen once"""
+        toggled_array = literal(sorted(toggled), ARRAY(Text))
+        current = func.coalesce(cast(Channel.reaction_settings, JSONB)['emojis'], literal([], JSONB))
+        unnested = func.unnest(toggled_array).table_valued('value')
+        added = (
+            select(func.jsonb_agg(unnested.c.value))
+            .where(not_(current.op('?', return_type=Boolean)(unnested.c.value)))
+            .scalar_subquery()
+        )
+        
+        try:
+            async with self.database.session() as session:
+                channel = await self._update_reaction_setting(
+                    session, channel_id, 'emojis',
+                    pg_value=current.op('-', return_type=JSONB)(toggled_array).op('||', return_type=JSONB)(
+                        func.coalesce(added, literal([], JSONB))
+                    ),
+                    py_value=lambda settings: _toggle_emojis(settings.get('emojis', ()), toggled)
+                )
+                
+                if not channel:
+                    # No reaction settings yet: start from the defaults
+                    channel = await session.get(Channel, channel_id)
+                    
+                    if not channel:
+                        return
+                    
+                    settings = dict(channel.reaction_settings or _DEFAULT_REACTION_SETTINGS)
+                    settings['emojis'] = _toggle_emojis(settings.get('emojis', ()), toggled)
+                    channel.reaction_settings = settings
+                
+                await session.commit()
+                self._invalidate_channels()
+                
+                # Refresh the emoji selection screen
+                try:
+                    await self._prompt_set_emojis(message, channel_id, edit=True)
+                except Exception:
+                    # If edit fails, send new message
+                    await self._prompt_set_emojis(message, channel_id, edit=False)
+        except Exception as e:
+            logger.error("Failed to save emojis for channel %s: %s", channel_id, e, exc_info=True)
     
     async def _set_reaction_count(self, message: Message, channel_id: int, count: int) -> None:
         """Set reaction count for a channel"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(select(Channel).where(Channel.id == channel_id))
-            channel = result.scalar_one_or_none()
+        async with self.database.session() as session:
+            channel = await self._update_reaction_setting(
+                session, channel_id, 'reaction_count',
+                pg_value=literal(count, Integer),
+                py_value=lambda settings: count
+            )
             
-            if not channel or not channel.reaction_settings:
+            if not channel:
                 return
             
-            settings = channel.reaction_settings
-            settings['reaction_count'] = count
-            channel.reaction_settings = settings
-            
             await session.commit()
-            await self._show_reaction_settings(message, channel_id, edit=True)
-        finally:
-            await session.close()
+            self._invalidate_channels()
+            await self._render_reaction_settings(message, channel, edit=True)
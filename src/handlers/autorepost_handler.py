@@ -3,19 +3,81 @@ Auto-repost command handler for managing channel reposting
 """
 
 import logging
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence
 from aiogram import Bot
-from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.types import Chat, Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.exceptions import TelegramAPIError
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import Config
+from src.handlers.common import admin_required, reply
 from src.models import RepostConfig, RepostStats
 from src.services.auto_repost_service import AutoRepostService
 
 logger = logging.getLogger(__name__)
 
+# How long a get_chat result is reused for repeated commands on the same channel
+CHAT_CACHE_TTL = 300
+
+# Repeats of the same read-only command from one admin within this window are dropped
+COMMAND_DEBOUNCE_SECONDS = 2.0
+
+# Repost queries built once at import and run with bound parameters
+_STMT_CONFIG_BY_SOURCE = select(RepostConfig).where(
+    RepostConfig.source_channel_id == bindparam("source_id")
+)
+_STMT_CONFIGS_WITH_STATS = select(RepostConfig, RepostStats).outerjoin(
+    RepostStats, RepostStats.config_id == RepostConfig.id
+)
+_STMT_CONFIG_WITH_STATS_BY_SOURCE = _STMT_CONFIGS_WITH_STATS.where(
+    RepostConfig.source_channel_id == bindparam("source_id")
+)
+# Summary counters only; plain rows, no ORM objects to hydrate
+_STMT_STATS_SUMMARY = select(
+    RepostConfig.source_channel_title,
+    RepostStats.total_reposts,
+    RepostStats.successful_reposts,
+    RepostStats.failed_reposts
+).outerjoin(RepostStats, RepostStats.config_id == RepostConfig.id)
+# Enable/disable in one round trip; an empty result means no such config
+_STMT_SET_CONFIG_ENABLED = (
+    update(RepostConfig)
+    .where(RepostConfig.source_channel_id == bindparam("source_id"))
+    .values(is_enabled=bindparam("enabled"), status=bindparam("new_status"))
+    .returning(RepostConfig.source_channel_title, RepostConfig.target_channel_title)
+)
+
+# Usage replies for subcommands called without their arguments
+_MSG_ADD_USAGE = (
+    "❌ Noto'g'ri format!\n\n"
+    "To'g'ri format:\n"
+    "/autorepost add <source_kanal> <target_kanal>\n\n"
+    "Misol:\n"
+    "/autorepost add @prikollar_vidyolar_videolar_klip @my_channel\n"
+    "yoki\n"
+    "/autorepost add -1001234567890 -1009876543210"
+)
+_MSG_REMOVE_USAGE = (
+    "❌ Noto'g'ri format!\n\n"
+    "To'g'ri format:\n"
+    "/autorepost remove <channel_id>\n\n"
+    "Misol:\n"
+    "/autorepost remove -1001234567890"
+)
+_MSG_ENABLE_USAGE = (
+    "❌ Noto'g'ri format!\n\n"
+    "To'g'ri format:\n"
+    "/autorepost enable <channel_id>"
+)
+_MSG_DISABLE_USAGE = (
+    "❌ Noto'g'ri format!\n\n"
+    "To'g'ri format:\n"
+    "/autorepost disable <channel_id>"
+)
+
 
 class AutoRepostHandler:
     """Handler for auto-repost commands"""
@@ -23,58 +85,75 @@ class AutoRepostHandler:
     def __init__(self, bot: Bot, config: Config):
         self.bot = bot
         self.config = config
-    
-    async def handle_autorepost_add(self, message: Message, session: AsyncSession) -> None:
-        """Handle /autorepost add command"""
-        user_id = message.from_user.id
         
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
+        # Chats keyed by the raw @username or chat id argument, with their fetch time
+        self._chat_cache: dict[str, tuple[float, Chat]] = {}
         
-        # Parse command: /autorepost add <source_channel> <target_channel>
-        parts = message.text.split()
+        # Last time each (user id, command text) was answered, oldest first;
+        # entries past the debounce window are dropped as new ones arrive
+        self._last_command: OrderedDict[tuple[int, str], float] = OrderedDict()
+    
+    def _is_repeat(self, message: Message) -> bool:
+        """Whether this exact command was already answered for the user moments ago"""
+        key = (message.from_user.id, message.text)
+        now = time.monotonic()
+        if now - self._last_command.get(key, float('-inf')) < COMMAND_DEBOUNCE_SECONDS:
+            return True
         
-        if len(parts) < 3:
-            await message.reply(
-                "❌ Noto'g'ri format!\n\n"
-                "To'g'ri format:\n"
-                "/autorepost add <source_kanal> <target_kanal>\n\n"
-                "Misol:\n"
-                "/autorepost add @prikollar_vidyolar_videolar_klip @my_channel\n"
-                "yoki\n"
-                "/autorepost add -1001234567890 -1009876543210"
-            )
+        self._last_command[key] = now
+        self._last_command.move_to_end(key)
+        while now - next(iter(self._last_command.values())) >= COMMAND_DEBOUNCE_SECONDS:
+            self._last_command.popitem(last=False)
+        return False
+    
+    async def _resolve_chat(self, ident: str) -> Chat:
+        """Resolve an @username or numeric chat id, reusing results for CHAT_CACHE_TTL seconds"""
+        cached = self._chat_cache.get(ident)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CHAT_CACHE_TTL:
+            return cached[1]
+        
+        chat = await self.bot.get_chat(ident if ident.startswith('@') else int(ident))
+        self._chat_cache[ident] = (now, chat)
+        return chat
+    
+    async def _resolve_channel_id(self, channel_input: str) -> int:
+        """Channel id for a command argument; only @usernames need a get_chat"""
+        if channel_input.startswith('@'):
+            return (await self._resolve_chat(channel_input)).id
+        return int(channel_input)
+    
+    @admin_required
+    async def handle_autorepost_add(
+        self,
+        message: Message,
+        session: AsyncSession,
+        args: Sequence[str]
+    ) -> None:
+        """Handle /autorepost add command"""
+        # Arguments after 'add': <source_channel> <target_channel>
+        if not args:
+            await reply(message, _MSG_ADD_USAGE)
             return
         
-        source_input = parts[2]
-        target_input = parts[3] if len(parts) > 3 else None
+        source_input = args[0]
+        target_input = args[1] if len(args) > 1 else None
         
         if not target_input:
-            await message.reply("❌ Target kanalini kiriting!")
+            await reply(message, "❌ Target kanalini kiriting!")
             return
         
         try:
-            # Get source channel info
-            if source_input.startswith('@'):
-                source_chat = await self.bot.get_chat(source_input)
-            else:
-                source_chat = await self.bot.get_chat(int(source_input))
-            
-            # Get target channel info
-            if target_input.startswith('@'):
-                target_chat = await self.bot.get_chat(target_input)
-            else:
-                target_chat = await self.bot.get_chat(int(target_input))
+            # Get source and target channel info
+            source_chat = await self._resolve_chat(source_input)
+            target_chat = await self._resolve_chat(target_input)
             
             # Check if config already exists
-            result = await session.execute(
-                select(RepostConfig).where(RepostConfig.source_channel_id == source_chat.id)
-            )
-            existing = result.scalar_one_or_none()
+            existing = await session.scalar(_STMT_CONFIG_BY_SOURCE, {"source_id": source_chat.id})
             
             if existing:
-                await message.reply(
+                await reply(
+                    message,
                     f"❌ Bu kanal allaqachon qo'shilgan!\n\n"
                     f"Source: {existing.source_channel_title}\n"
                     f"Target: {existing.target_channel_title}\n"
@@ -82,7 +161,7 @@ class AutoRepostHandler:
                 )
                 return
             
-            # Create new config
+            # Create new config with its initial stats; both rows go out in one flush
             config = RepostConfig(
                 source_channel_id=source_chat.id,
                 source_channel_title=source_chat.title or source_chat.username or str(source_chat.id),
@@ -90,18 +169,14 @@ class AutoRepostHandler:
                 target_channel_id=target_chat.id,
                 target_channel_title=target_chat.title or target_chat.username or str(target_chat.id),
                 is_enabled=True,
-                status='active'
+                status='active',
+                stats=RepostStats()
             )
             session.add(config)
-            await session.flush()  # Flush to get config.id
-            
-            # Create initial stats
-            stats = RepostStats(config_id=config.id)
-            session.add(stats)
-            
             await session.commit()
             
-            await message.reply(
+            await reply(
+                message,
                 f"✅ Kanal muvaffaqiyatli qo'shildi!\n\n"
                 f"📥 Source: {config.source_channel_title}\n"
                 f"📤 Target: {config.target_channel_title}\n"
@@ -111,44 +186,41 @@ class AutoRepostHandler:
             )
             
         except TelegramAPIError as e:
-            await message.reply(f"❌ Xatolik: {e}")
+            await reply(message, f"❌ Xatolik: {e}")
         except Exception as e:
             logger.error(f"Error adding repost config: {e}")
-            await message.reply(f"❌ Xatolik yuz berdi: {e}")
+            await reply(message, f"❌ Xatolik yuz berdi: {e}")
     
-    async def handle_autorepost_list(self, message: Message, session: AsyncSession) -> None:
+    @admin_required
+    async def handle_autorepost_list(
+        self,
+        message: Message,
+        session: AsyncSession,
+        args: Sequence[str]
+    ) -> None:
         """Handle /autorepost list command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
+        if self._is_repeat(message):
             return
         
         try:
-            # Get all configs
-            result = await session.execute(select(RepostConfig))
-            configs = result.scalars().all()
+            # Get all configs with their stats in one query
+            result = await session.execute(_STMT_CONFIGS_WITH_STATS)
+            rows = result.all()
             
-            if not configs:
-                await message.reply("📋 Hech qanday kanal qo'shilmagan.")
+            if not rows:
+                await reply(message, "📋 Hech qanday kanal qo'shilmagan.")
                 return
             
             # Build response
-            response = "📋 Auto-repost kanallari:\n\n"
+            parts = ["📋 Auto-repost kanallari:\n\n"]
             
-            for config in configs:
+            for config, stats in rows:
                 status_emoji = "✅" if config.is_enabled else "❌"
                 status_text = "Yoqilgan" if config.is_enabled else "O'chirilgan"
                 
-                # Get stats
-                stats_result = await session.execute(
-                    select(RepostStats).where(RepostStats.config_id == config.id)
-                )
-                stats = stats_result.scalar_one_or_none()
-                
                 total = stats.total_reposts if stats else 0
                 
-                response += (
+                parts.append(
                     f"{status_emoji} **{config.source_channel_title}**\n"
                     f"   → {config.target_channel_title}\n"
                     f"   📊 Jami: {total} ta post\n"
@@ -156,59 +228,46 @@ class AutoRepostHandler:
                     f"   ID: `{config.source_channel_id}`\n\n"
                 )
             
-            response += "\n💡 Konfiguratsiya: /autorepost config <channel_id>"
+            parts.append("\n💡 Konfiguratsiya: /autorepost config <channel_id>")
             
-            await message.reply(response, parse_mode="Markdown")
+            await reply(message, "".join(parts), parse_mode="Markdown")
             
         except Exception as e:
             logger.error(f"Error listing repost configs: {e}")
-            await message.reply(f"❌ Xatolik: {e}")
+            await reply(message, f"❌ Xatolik: {e}")
     
-    async def handle_autorepost_remove(self, message: Message, session: AsyncSession) -> None:
+    @admin_required
+    async def handle_autorepost_remove(
+        self,
+        message: Message,
+        session: AsyncSession,
+        args: Sequence[str]
+    ) -> None:
         """Handle /autorepost remove command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
+        if not args:
+            await reply(message, _MSG_REMOVE_USAGE)
             return
         
-        parts = message.text.split()
-        
-        if len(parts) < 3:
-            await message.reply(
-                "❌ Noto'g'ri format!\n\n"
-                "To'g'ri format:\n"
-                "/autorepost remove <channel_id>\n\n"
-                "Misol:\n"
-                "/autorepost remove -1001234567890"
-            )
-            return
-        
-        channel_input = parts[2]
+        channel_input = args[0]
         
         try:
             # Parse channel ID
-            if channel_input.startswith('@'):
-                chat = await self.bot.get_chat(channel_input)
-                channel_id = chat.id
-            else:
-                channel_id = int(channel_input)
+            channel_id = await self._resolve_channel_id(channel_input)
             
             # Find config
-            result = await session.execute(
-                select(RepostConfig).where(RepostConfig.source_channel_id == channel_id)
-            )
-            config = result.scalar_one_or_none()
+            config = await session.scalar(_STMT_CONFIG_BY_SOURCE, {"source_id": channel_id})
             
             if not config:
-                await message.reply("❌ Kanal topilmadi!")
+                await reply(message, "❌ Kanal topilmadi!")
                 return
             
             # Delete config (cascade deletes logs and stats)
             await session.delete(config)
             await session.commit()
+            self._chat_cache.pop(channel_input, None)
             
-            await message.reply(
+            await reply(
+                message,
                 f"✅ Kanal o'chirildi!\n\n"
                 f"Source: {config.source_channel_title}\n"
                 f"Target: {config.target_channel_title}"
@@ -216,200 +275,174 @@ class AutoRepostHandler:
             
         except Exception as e:
             logger.error(f"Error removing repost config: {e}")
-            await message.reply(f"❌ Xatolik: {e}")
+            await reply(message, f"❌ Xatolik: {e}")
     
-    async def handle_autorepost_enable(self, message: Message, session: AsyncSession) -> None:
+    @admin_required
+    async def handle_autorepost_enable(
+        self,
+        message: Message,
+        session: AsyncSession,
+        args: Sequence[str]
+    ) -> None:
         """Handle /autorepost enable command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
+        if not args:
+            await reply(message, _MSG_ENABLE_USAGE)
             return
         
-        parts = message.text.split()
-        
-        if len(parts) < 3:
-            await message.reply(
-                "❌ Noto'g'ri format!\n\n"
-                "To'g'ri format:\n"
-                "/autorepost enable <channel_id>"
-            )
-            return
-        
-        channel_input = parts[2]
+        channel_input = args[0]
         
         try:
             # Parse channel ID
-            if channel_input.startswith('@'):
-                chat = await self.bot.get_chat(channel_input)
-                channel_id = chat.id
-            else:
-                channel_id = int(channel_input)
+            channel_id = await self._resolve_channel_id(channel_input)
             
-            # Find config
+            # Update and fetch the titles in one statement
             result = await session.execute(
-                select(RepostConfig).where(RepostConfig.source_channel_id == channel_id)
+                _STMT_SET_CONFIG_ENABLED,
+                {"source_id": channel_id, "enabled": True, "new_status": 'active'}
             )
-            config = result.scalar_one_or_none()
+            row = result.first()
             
-            if not config:
-                await message.reply("❌ Kanal topilmadi!")
+            if row is None:
+                await reply(message, "❌ Kanal topilmadi!")
                 return
             
-            config.is_enabled = True
-            config.status = 'active'
             await session.commit()
             
-            await message.reply(
+            await reply(
+                message,
                 f"✅ Kanal yoqildi!\n\n"
-                f"Source: {config.source_channel_title}\n"
-                f"Target: {config.target_channel_title}"
+                f"Source: {row.source_channel_title}\n"
+                f"Target: {row.target_channel_title}"
             )
             
         except Exception as e:
             logger.error(f"Error enabling repost config: {e}")
-            await message.reply(f"❌ Xatolik: {e}")
+            await reply(message, f"❌ Xatolik: {e}")
     
-    async def handle_autorepost_disable(self, message: Message, session: AsyncSession) -> None:
+    @admin_required
+    async def handle_autorepost_disable(
+        self,
+        message: Message,
+        session: AsyncSession,
+        args: Sequence[str]
+    ) -> None:
         """Handle /autorepost disable command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
+        if not args:
+            await reply(message, _MSG_DISABLE_USAGE)
             return
         
-        parts = message.text.split()
-        
-        if len(parts) < 3:
-            await message.reply(
-                "❌ Noto'g'ri format!\n\n"
-                "To'g'ri format:\n"
-                "/autorepost disable <channel_id>"
-            )
-            return
-        
-        channel_input = parts[2]
+        channel_input = args[0]
         
         try:
             # Parse channel ID
-            if channel_input.startswith('@'):
-                chat = await self.bot.get_chat(channel_input)
-                channel_id = chat.id
-            else:
-                channel_id = int(channel_input)
+            channel_id = await self._resolve_channel_id(channel_input)
             
-            # Find config
+            # Update and fetch the titles in one statement
             result = await session.execute(
-                select(RepostConfig).where(RepostConfig.source_channel_id == channel_id)
+                _STMT_SET_CONFIG_ENABLED,
+                {"source_id": channel_id, "enabled": False, "new_status": 'disabled'}
             )
-            config = result.scalar_one_or_none()
+            row = result.first()
             
-            if not config:
-                await message.reply("❌ Kanal topilmadi!")
+            if row is None:
+                await reply(message, "❌ Kanal topilmadi!")
                 return
             
-            config.is_enabled = False
-            config.status = 'disabled'
             await session.commit()
             
-            await message.reply(
+            await reply(
+                message,
                 f"✅ Kanal o'chirildi!\n\n"
-                f"Source: {config.source_channel_title}\n"
-                f"Target: {config.target_channel_title}"
+                f"Source: {row.source_channel_title}\n"
+                f"Target: {row.target_channel_title}"
             )
             
         except Exception as e:
             logger.error(f"Error disabling repost config: {e}")
-            await message.reply(f"❌ Xatolik: {e}")
+            await reply(message, f"❌ Xatolik: {e}")
     
-    async def handle_autorepost_stats(self, message: Message, session: AsyncSession) -> None:
+    @admin_required
+    async def handle_autorepost_stats(
+        self,
+        message: Message,
+        session: AsyncSession,
+        args: Sequence[str]
+    ) -> None:
         """Handle /autorepost stats command"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
+        if self._is_repeat(message):
             return
         
-        parts = message.text.split()
         channel_id = None
         
-        if len(parts) >= 3:
-            channel_input = parts[2]
-            try:
-                if channel_input.startswith('@'):
-                    chat = await self.bot.get_chat(channel_input)
-                    channel_id = chat.id
-                else:
-                    channel_id = int(channel_input)
-            except:
-                pass
+        if args:
+            channel_input = args[0]
+            if channel_input.startswith('@'):
+                try:
+                    channel_id = (await self._resolve_chat(channel_input)).id
+                except TelegramAPIError:
+                    pass  # Unknown username: fall back to all channels
+            elif channel_input.removeprefix('-').isdecimal():
+                channel_id = int(channel_input)
         
         try:
             if channel_id:
-                # Get stats for specific channel
-                result = await session.execute(
-                    select(RepostConfig).where(RepostConfig.source_channel_id == channel_id)
-                )
-                config = result.scalar_one_or_none()
+                # Get config and stats for specific channel
+                result = await session.execute(_STMT_CONFIG_WITH_STATS_BY_SOURCE, {"source_id": channel_id})
+                row = result.one_or_none()
                 
-                if not config:
-                    await message.reply("❌ Kanal topilmadi!")
+                if not row:
+                    await reply(message, "❌ Kanal topilmadi!")
                     return
                 
-                stats_result = await session.execute(
-                    select(RepostStats).where(RepostStats.config_id == config.id)
-                )
-                stats = stats_result.scalar_one_or_none()
+                config, stats = row
                 
                 if not stats:
-                    await message.reply("📊 Statistika topilmadi.")
+                    await reply(message, "📊 Statistika topilmadi.")
                     return
                 
-                response = (
+                parts = [
                     f"📊 **{config.source_channel_title}** statistikasi:\n\n"
                     f"📥 Jami: {stats.total_reposts}\n"
                     f"✅ Muvaffaqiyatli: {stats.successful_reposts}\n"
                     f"❌ Xato: {stats.failed_reposts}\n"
                     f"🚫 Filtrlangan: {stats.filtered_posts}\n\n"
-                )
+                ]
                 
                 if stats.content_type_counts:
-                    response += "📋 Kontent turlari:\n"
-                    for content_type, count in stats.content_type_counts.items():
-                        response += f"   • {content_type}: {count}\n"
+                    parts.append("📋 Kontent turlari:\n")
+                    parts.extend(
+                        f"   • {content_type}: {count}\n"
+                        for content_type, count in stats.content_type_counts.items()
+                    )
                 
                 if stats.last_repost_at:
-                    response += f"\n🕐 Oxirgi repost: {stats.last_repost_at.strftime('%Y-%m-%d %H:%M')}"
+                    parts.append(f"\n🕐 Oxirgi repost: {stats.last_repost_at.strftime('%Y-%m-%d %H:%M')}")
                 
-                await message.reply(response, parse_mode="Markdown")
+                await reply(message, "".join(parts), parse_mode="Markdown")
                 
             else:
-                # Get stats for all channels
-                result = await session.execute(select(RepostConfig))
-                configs = result.scalars().all()
+                # Get counters for all channels in one query
+                result = await session.execute(_STMT_STATS_SUMMARY)
+                rows = result.all()
                 
-                if not configs:
-                    await message.reply("📊 Hech qanday kanal qo'shilmagan.")
+                if not rows:
+                    await reply(message, "📊 Hech qanday kanal qo'shilmagan.")
                     return
                 
-                response = "📊 Barcha kanallar statistikasi:\n\n"
+                parts = ["📊 Barcha kanallar statistikasi:\n\n"]
                 
-                for config in configs:
-                    stats_result = await session.execute(
-                        select(RepostStats).where(RepostStats.config_id == config.id)
-                    )
-                    stats = stats_result.scalar_one_or_none()
-                    
-                    if stats:
-                        response += (
-                            f"**{config.source_channel_title}**\n"
-                            f"   Jami: {stats.total_reposts} | "
-                            f"✅ {stats.successful_reposts} | "
-                            f"❌ {stats.failed_reposts}\n\n"
+                for title, total, successful, failed in rows:
+                    # Outer join yields NULL counters for configs without a stats row
+                    if total is not None:
+                        parts.append(
+                            f"**{title}**\n"
+                            f"   Jami: {total} | "
+                            f"✅ {successful} | "
+                            f"❌ {failed}\n\n"
                         )
                 
-                await message.reply(response, parse_mode="Markdown")
+                await reply(message, "".join(parts), parse_mode="Markdown")
                 
         except Exception as e:
             logger.error(f"Error getting repost stats: {e}")
-            await message.reply(f"❌ Xatolik: {e}")
+            await reply(message, f"❌ Xatolik: {e}")
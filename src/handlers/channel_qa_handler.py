@@ -3,16 +3,49 @@ Channel Q&A Handler - Manages channels for Q&A functionality
 """
 
 import logging
+import time
 from aiogram import Bot
-from aiogram.types import Message
-from sqlalchemy import select
+from aiogram.types import Chat, Message
+from sqlalchemy import bindparam, select
 
 from src.config import Config
 from src.database import Database
+from src.handlers.common import admin_required
 from src.models import Channel
 
 logger = logging.getLogger(__name__)
 
+# How long a get_chat result is reused for repeated commands on the same channel
+CHAT_CACHE_TTL = 300
+
+# Channel queries built once at import and run with bound parameters
+_STMT_CHANNEL_BY_CHAT_ID = select(Channel).where(Channel.channel_id == bindparam("chat_id"))
+# /listchannels only shows these columns, so rows skip ORM instantiation and
+# the JSON settings columns
+_STMT_CHANNEL_LIST = select(
+    Channel.channel_title,
+    Channel.channel_id,
+    Channel.mode,
+    Channel.is_active
+)
+
+# Fixed replies for malformed commands
+_MSG_ADD_USAGE = (
+    "❌ Noto'g'ri format!\n\n"
+    "To'g'ri format:\n"
+    "/addchannel -1001234567890\n\n"
+    "Kanal ID ni olish uchun:\n"
+    "1. Kanalga post qo'shing\n"
+    "2. Postni forward qiling @userinfobot ga\n"
+    "3. Bot sizga kanal ID ni beradi"
+)
+_MSG_REMOVE_USAGE = (
+    "❌ Noto'g'ri format!\n\n"
+    "To'g'ri format:\n"
+    "/removechannel -1001234567890"
+)
+_MSG_BAD_CHANNEL_ID = "❌ Kanal ID raqam bo'lishi kerak!"
+
 
 class ChannelQAHandler:
     """Handler for channel Q&A management"""
@@ -21,40 +54,39 @@ class ChannelQAHandler:
         self.bot = bot
         self.database = database
         self.config = config
+        
+        # Chats keyed by chat id, with their fetch time
+        self._chat_cache: dict[int, tuple[float, Chat]] = {}
     
+    async def _resolve_chat(self, chat_id: int) -> Chat:
+        """Fetch a chat via get_chat, reusing results for CHAT_CACHE_TTL seconds"""
+        cached = self._chat_cache.get(chat_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CHAT_CACHE_TTL:
+            return cached[1]
+        
+        chat = await self.bot.get_chat(chat_id)
+        self._chat_cache[chat_id] = (now, chat)
+        return chat
+    
+    @admin_required
     async def handle_addchannel_command(self, message: Message) -> None:
         """Handle /addchannel command - add channel by ID"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         # Parse command: /addchannel <channel_id>
         parts = message.text.split()
         
         if len(parts) < 2:
-            await message.reply(
-                "❌ Noto'g'ri format!\n\n"
-                "To'g'ri format:\n"
-                "/addchannel -1001234567890\n\n"
-                "Kanal ID ni olish uchun:\n"
-                "1. Kanalga post qo'shing\n"
-                "2. Postni forward qiling @userinfobot ga\n"
-                "3. Bot sizga kanal ID ni beradi",
-                parse_mode=None
-            )
+            await message.reply(_MSG_ADD_USAGE, parse_mode=None)
             return
         
-        try:
-            channel_id = int(parts[1])
-        except ValueError:
-            await message.reply("❌ Kanal ID raqam bo'lishi kerak!")
+        if not parts[1].removeprefix('-').isdecimal():
+            await message.reply(_MSG_BAD_CHANNEL_ID)
             return
+        channel_id = int(parts[1])
         
         # Get channel info from Telegram
         try:
-            chat = await self.bot.get_chat(channel_id)
+            chat = await self._resolve_chat(channel_id)
             channel_title = chat.title or chat.username or str(channel_id)
         except Exception as e:
             await message.reply(
@@ -67,149 +99,119 @@ class ChannelQAHandler:
             return
         
         # Check if channel already exists
-        session = await self.database.get_session()
         try:
-            result = await session.execute(
-                select(Channel).where(Channel.channel_id == channel_id)
-            )
-            existing = result.scalar_one_or_none()
-            
-            if existing:
+            async with self.database.session() as session:
+                existing = await session.scalar(_STMT_CHANNEL_BY_CHAT_ID, {"chat_id": channel_id})
+                
+                if existing:
+                    await message.reply(
+                        f"✅ Kanal allaqachon qo'shilgan!\n\n"
+                        f"📢 Kanal: {existing.channel_title}\n"
+                        f"🆔 ID: {existing.channel_id}\n"
+                        f"📊 Status: {'✅ Faol' if existing.is_active else '❌ Nofaol'}\n"
+                        f"🤖 Mode: {existing.mode}\n\n"
+                        f"Endi kanalga savol yozib, bot javob beradi!",
+                        parse_mode=None
+                    )
+                    return
+                
+                # Create new channel
+                channel = Channel(
+                    channel_id=channel_id,
+                    channel_title=channel_title,
+                    is_active=True,
+                    mode='comment'  # Default mode for Q&A
+                )
+                
+                session.add(channel)
+                await session.commit()
+                await session.refresh(channel)
+                
                 await message.reply(
-                    f"✅ Kanal allaqachon qo'shilgan!\n\n"
-                    f"📢 Kanal: {existing.channel_title}\n"
-                    f"🆔 ID: {existing.channel_id}\n"
-                    f"📊 Status: {'✅ Faol' if existing.is_active else '❌ Nofaol'}\n"
-                    f"🤖 Mode: {existing.mode}\n\n"
-                    f"Endi kanalga savol yozib, bot javob beradi!",
+                    f"✅ Kanal muvaffaqiyatli qo'shildi!\n\n"
+                    f"📢 Kanal: {channel_title}\n"
+                    f"🆔 ID: {channel_id}\n"
+                    f"🤖 Mode: Q&A (har bir postga javob beradi)\n\n"
+                    f"🎉 Endi kanalga savol yozib, bot avtomatik javob beradi!\n\n"
+                    f"💡 Maslahat:\n"
+                    f"• Texnik savollar uchun: Python, JavaScript, React, Django va boshqalar\n"
+                    f"• Oddiy savollar uchun: har qanday mavzu\n"
+                    f"• Bot har bir postga javob beradi!",
                     parse_mode=None
                 )
-                return
-            
-            # Create new channel
-            channel = Channel(
-                channel_id=channel_id,
-                channel_title=channel_title,
-                is_active=True,
-                mode='comment'  # Default mode for Q&A
-            )
-            
-            session.add(channel)
-            await session.commit()
-            await session.refresh(channel)
-            
-            await message.reply(
-                f"✅ Kanal muvaffaqiyatli qo'shildi!\n\n"
-                f"📢 Kanal: {channel_title}\n"
-                f"🆔 ID: {channel_id}\n"
-                f"🤖 Mode: Q&A (har bir postga javob beradi)\n\n"
-                f"🎉 Endi kanalga savol yozib, bot avtomatik javob beradi!\n\n"
-                f"💡 Maslahat:\n"
-                f"• Texnik savollar uchun: Python, JavaScript, React, Django va boshqalar\n"
-                f"• Oddiy savollar uchun: har qanday mavzu\n"
-                f"• Bot har bir postga javob beradi!",
-                parse_mode=None
-            )
-            
-            logger.info(f"Channel added: {channel_title} (ID: {channel_id})")
-            
+                
+                logger.info(f"Channel added: {channel_title} (ID: {channel_id})")
+                
         except Exception as e:
-            await session.rollback()
             logger.error(f"Error adding channel: {e}")
             await message.reply(f"❌ Xatolik yuz berdi: {e}")
-        finally:
-            await session.close()
     
+    @admin_required
     async def handle_listchannels_command(self, message: Message) -> None:
         """Handle /listchannels command - list all channels"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
-        session = await self.database.get_session()
         try:
-            result = await session.execute(select(Channel))
-            channels = result.scalars().all()
-            
-            if not channels:
-                await message.reply("📋 Hech qanday kanal qo'shilmagan.")
-                return
-            
-            response = "📋 Qo'shilgan kanallar:\n\n"
-            
-            for channel in channels:
-                status_emoji = "✅" if channel.is_active else "❌"
-                response += (
-                    f"{status_emoji} {channel.channel_title}\n"
-                    f"   🆔 ID: {channel.channel_id}\n"
-                    f"   🤖 Mode: {channel.mode}\n"
-                    f"   📊 Status: {'Faol' if channel.is_active else 'Nofaol'}\n\n"
-                )
-            
-            response += "\n💡 Kanal qo'shish: /addchannel [channel_id]"
-            
-            await message.reply(response, parse_mode=None)
-            
+            async with self.database.session() as session:
+                channels = (await session.execute(_STMT_CHANNEL_LIST)).all()
+                
+                if not channels:
+                    await message.reply("📋 Hech qanday kanal qo'shilmagan.")
+                    return
+                
+                parts = ["📋 Qo'shilgan kanallar:\n\n"]
+                
+                for channel in channels:
+                    status_emoji = "✅" if channel.is_active else "❌"
+                    parts.append(
+                        f"{status_emoji} {channel.channel_title}\n"
+                        f"   🆔 ID: {channel.channel_id}\n"
+                        f"   🤖 Mode: {channel.mode}\n"
+                        f"   📊 Status: {'Faol' if channel.is_active else 'Nofaol'}\n\n"
+                    )
+                
+                parts.append("\n💡 Kanal qo'shish: /addchannel [channel_id]")
+                
+                await message.reply("".join(parts), parse_mode=None)
+                
         except Exception as e:
             logger.error(f"Error listing channels: {e}")
             await message.reply(f"❌ Xatolik: {e}")
-        finally:
-            await session.close()
     
+    @admin_required
     async def handle_removechannel_command(self, message: Message) -> None:
         """Handle /removechannel command - remove channel"""
-        user_id = message.from_user.id
-        
-        if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply("❌ Sizda admin huquqlari yo'q.")
-            return
-        
         parts = message.text.split()
         
         if len(parts) < 2:
-            await message.reply(
-                "❌ Noto'g'ri format!\n\n"
-                "To'g'ri format:\n"
-                "/removechannel -1001234567890",
-                parse_mode=None
-            )
+            await message.reply(_MSG_REMOVE_USAGE, parse_mode=None)
             return
         
-        try:
-            channel_id = int(parts[1])
-        except ValueError:
-            await message.reply("❌ Kanal ID raqam bo'lishi kerak!")
+        if not parts[1].removeprefix('-').isdecimal():
+            await message.reply(_MSG_BAD_CHANNEL_ID)
             return
+        channel_id = int(parts[1])
         
-        session = await self.database.get_session()
         try:
-            result = await session.execute(
-                select(Channel).where(Channel.channel_id == channel_id)
-            )
-            channel = result.scalar_one_or_none()
-            
-            if not channel:
-                await message.reply("❌ Kanal topilmadi!")
-                return
-            
-            channel_title = channel.channel_title
-            await session.delete(channel)
-            await session.commit()
-            
-            await message.reply(
-                f"✅ Kanal o'chirildi!\n\n"
-                f"📢 Kanal: {channel_title}\n"
-                f"🆔 ID: {channel_id}",
-                parse_mode=None
-            )
-            
-            logger.info(f"Channel removed: {channel_title} (ID: {channel_id})")
-            
+            async with self.database.session() as session:
+                channel = await session.scalar(_STMT_CHANNEL_BY_CHAT_ID, {"chat_id": channel_id})
+                
+                if not channel:
+                    await message.reply("❌ Kanal topilmadi!")
+                    return
+                
+                channel_title = channel.channel_title
+                await session.delete(channel)
+                await session.commit()
+                self._chat_cache.pop(channel_id, None)
+                
+                await message.reply(
+                    f"✅ Kanal o'chirildi!\n\n"
+                    f"📢 Kanal: {channel_title}\n"
+                    f"🆔 ID: {channel_id}",
+                    parse_mode=None
+                )
+                
+                logger.info(f"Channel removed: {channel_title} (ID: {channel_id})")
+                
         except Exception as e:
-            await session.rollback()
             logger.error(f"Error removing channel: {e}")
             await message.reply(f"❌ Xatolik: {e}")
-        finally:
-            await session.close()
@@ -0,0 +1,35 @@
+"""
+Helpers shared by the command handlers
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Final
+from aiogram.types import Message
+from asyncio_throttle import Throttler
+
+MSG_NOT_ADMIN: Final = "❌ Sizda admin huquqlari yo'q."
+
+# Outgoing replies stay just under Telegram's ~30 messages/second per bot
+_REPLY_THROTTLER = Throttler(rate_limit=29, period=1.0)
+
+
+async def reply(message: Message, text: str, **kwargs) -> Message:
+    """Reply to a message once the shared send budget allows it"""
+    async with _REPLY_THROTTLER:
+        return await message.reply(text, **kwargs)
+
+
+def admin_required(handler: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Guard a handler method so only configured admins reach its body
+
+    For command handlers that are dispatched by hand rather than through
+    the admin router and its AdminOnlyMiddleware.
+    """
+    @wraps(handler)
+    async def wrapper(self, message: Message, *args: Any, **kwargs: Any) -> Any:
+        if message.from_user is None or message.from_user.id not in self.config.ADMIN_USER_IDS:
+            await reply(message, MSG_NOT_ADMIN)
+            return None
+        return await handler(self, message, *args, **kwargs)
+
+    return wrapper
@@ -3,10 +3,12 @@ Message handler for processing comments from discussion groups
 """
 
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional
 from aiogram import Bot
 from aiogram.types import Message
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from ..config import Config
 from ..database import Database
@@ -16,6 +18,22 @@ from ..services.response_generator import ResponseGenerator
 
 logger = logging.getLogger(__name__)
 
+# Discussion group -> channel lookups are reused for this many seconds, and at
+# most this many groups are remembered
+CHANNEL_CACHE_TTL = 60
+CHANNEL_CACHE_SIZE = 1024
+
+# Discussion group lookup built once at import and run with a bound parameter
+_STMT_CHANNEL_BY_DISCUSSION_GROUP = select(Channel).where(
+    Channel.discussion_group_id == bindparam("group_id"),
+    Channel.is_active.is_(True)
+)
+
+_MSG_SETUP_NOT_ADMIN = (
+    "❌ Faqat adminlar kanal sozlay oladi.\n"
+    "Agar siz admin bo'lsangiz, bot konfiguratsiyasida user ID ni qo'shing."
+)
+
 
 class MessageHandler:
     """Handler for processing messages from discussion groups"""
@@ -26,62 +44,70 @@ class MessageHandler:
         self.config = config
         self.comment_monitor = CommentMonitor(bot, database, config)
         self.response_generator = ResponseGenerator(bot, database, config)
+        
+        # Channel (or None) per discussion group id with its load time, least
+        # recently used first
+        self._channel_cache: OrderedDict[int, tuple[float, Optional[Channel]]] = OrderedDict()
     
     async def handle_message(self, message: Message) -> None:
         """Handle incoming messages"""
         try:
             # Debug: log all messages
-            logger.info(f"Received message from chat {message.chat.id}: {message.text}")
+            logger.debug("Received message from chat %s: %s", message.chat.id, message.text)
             
             # Skip if no text
             if not message.text:
-                logger.info("Skipping message: no text")
+                logger.debug("Skipping message: no text")
                 return
             
             # Skip bot messages
             if message.from_user and message.from_user.is_bot:
-                logger.info("Skipping message: from bot")
+                logger.debug("Skipping message: from bot")
                 return
             
             # Check if message is from a monitored discussion group
             chat_id = message.chat.id
-            logger.info(f"Looking for channel with discussion_group_id: {chat_id}")
+            logger.debug("Looking for channel with discussion_group_id: %s", chat_id)
             
             channel = await self._get_channel_by_discussion_group(chat_id)
             
             if not channel:
-                logger.info(f"No channel found for discussion group {chat_id}")
+                logger.debug("No channel found for discussion group %s", chat_id)
                 # Check if this is a setup command in a new group
                 if message.text.startswith('/setup'):
-                    logger.info("Processing setup command")
+                    logger.info("Processing setup command in chat %s", chat_id)
                     await self._handle_setup_command(message)
                 else:
-                    logger.info("Not a setup command, ignoring")
+                    logger.debug("Not a setup command, ignoring")
                 return
             
-            logger.info(f"Found channel {channel.id} for discussion group {chat_id}")
+            logger.debug("Found channel %s for discussion group %s", channel.id, chat_id)
             
             # Process the comment
             await self.comment_monitor.process_comment(message, channel)
             
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Error handling message: %s", e)
     
     async def _get_channel_by_discussion_group(self, discussion_group_id: int) -> Optional[Channel]:
-        """Get channel by discussion group ID"""
-        session = await self.database.get_session()
-        try:
-            result = await session.execute(
-                select(Channel).where(
-                    Channel.discussion_group_id == discussion_group_id,
-                    Channel.is_active == True
-                )
+        """Get channel by discussion group ID, reusing results for CHANNEL_CACHE_TTL seconds"""
+        now = time.monotonic()
+        cached = self._channel_cache.get(discussion_group_id)
+        if cached is not None and now - cached[0] < CHANNEL_CACHE_TTL:
+            self._channel_cache.move_to_end(discussion_group_id)
+            return cached[1]
+        
+        async with self.database.session() as session:
+            channel = await session.scalar(
+                _STMT_CHANNEL_BY_DISCUSSION_GROUP, {"group_id": discussion_group_id}
             )
-            return result.scalar_one_or_none()
-        finally:
-            await session.close()
+        
+        # Misses are cached too, so chatter in unlinked groups stays off the database
+        self._channel_cache[discussion_group_id] = (now, channel)
+        self._channel_cache.move_to_end(discussion_group_id)
+        if len(self._channel_cache) > CHANNEL_CACHE_SIZE:
+            self._channel_cache.popitem(last=False)
+        return channel
     
     async def _handle_setup_command(self, message: Message) -> None:
         """Handle /setup command for linking discussion group to channel"""
@@ -89,10 +115,7 @@ class MessageHandler:
         
         # Check if user is admin
         if user_id not in self.config.ADMIN_USER_IDS:
-            await message.reply(
-                "❌ Faqat adminlar kanal sozlay oladi.\n"
-                "Agar siz admin bo'lsangiz, bot konfiguratsiyasida user ID ni qo'shing."
-            )
+            await message.reply(_MSG_SETUP_NOT_ADMIN)
             return
         
         chat_id = message.chat.id
@@ -108,8 +131,7 @@ class MessageHandler:
         
         # For now, we'll create a basic channel entry
         # In a full implementation, you'd want to verify the linked channel
-        session = await self.database.get_session()
-        try:
+        async with self.database.session() as session:
             new_channel = Channel(
                 channel_id=0,  # Will be updated when we detect the actual channel
                 channel_title=f"Channel for {chat_title}",
@@ -120,6 +142,7 @@ class MessageHandler:
             
             session.add(new_channel)
             await session.commit()
+            self._channel_cache.pop(chat_id, None)
             
             await message.reply(
                 f"✅ Discussion group '{chat_title}' muvaffaqiyatli ulandi!\n\n"
@@ -129,5 +152,3 @@ class MessageHandler:
                 f"3. AI javoblarini yoqing va trigger so'zlarni sozlang\n\n"
                 f"🤖 Bot endi bu groupdagi har qanday komentga javob beradi!"
             )
-        finally:
-            await session.close()
\ No newline at end of file
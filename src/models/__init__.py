@@ -2,6 +2,10 @@
 Database models package
 """
 
+# Every model module is imported eagerly on purpose: Base.metadata.create_all
+# and Alembic autogenerate only see tables whose classes have been imported,
+# and relationships refer to other models by class name, which must be
+# registered before the mappers are configured.
 from .base import Base, TimestampMixin
 from .channel import Channel
 from .comment import Comment, CommentCategory
@@ -4,7 +4,7 @@ ActivityLog model for tracking reaction boost activities
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, JSON
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -21,7 +21,7 @@ class ActivityLog(Base):
         ForeignKey("channels.id", ondelete="CASCADE"),
         nullable=False
     )
-    post_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    post_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     activity_type: Mapped[str] = mapped_column(String(50), nullable=False)
     details: Mapped[dict] = mapped_column(JSON, nullable=False)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -29,9 +29,11 @@ class ActivityLog(Base):
     # Relationship to Channel
     channel = relationship("Channel", back_populates="activity_logs")
     
-    # Create index on (channel_id, timestamp) for efficient queries
+    # Create index on (channel_id, timestamp) for efficient queries, plus one
+    # with activity_type in between for per-type history (e.g. a channel's errors)
     __table_args__ = (
         Index('idx_channel_timestamp', 'channel_id', 'timestamp'),
+        Index('idx_channel_type_ts', 'channel_id', 'activity_type', 'timestamp'),
     )
     
     def __repr__(self) -> str:
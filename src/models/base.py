@@ -13,6 +13,10 @@ Base = declarative_base()
 class TimestampMixin:
     """Mixin for adding timestamp fields to models"""
     
+    # Fetch server-generated timestamps during flush (RETURNING where
+    # supported) so they never trigger a lazy load after commit
+    __mapper_args__ = {"eager_defaults": True}
+    
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(),
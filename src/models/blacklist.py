@@ -4,7 +4,7 @@ Blacklist model for spam protection
 
 from enum import Enum
 from typing import Optional
-from sqlalchemy import Boolean, Integer, String, Text, Enum as SQLEnum
+from sqlalchemy import BigInteger, Boolean, Index, Integer, String, Text, Enum as SQLEnum, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -29,7 +29,7 @@ class Blacklist(Base, TimestampMixin):
     )
     
     # Entry data
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    user_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     keyword: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     pattern: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
@@ -40,6 +40,13 @@ class Blacklist(Base, TimestampMixin):
     # Global or channel-specific (None = global)
     channel_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
+    # Spam check filters by type, active flag and channel; user bans are found
+    # through user_id, indexed only where set (partial on PostgreSQL)
+    __table_args__ = (
+        Index('idx_bl_type_active_channel', 'entry_type', 'is_active', 'channel_id'),
+        Index('idx_bl_user', 'user_id', postgresql_where=text('user_id IS NOT NULL')),
+    )
+    
     def __repr__(self) -> str:
         return f"<Blacklist(id={self.id}, type={self.entry_type.value}, active={self.is_active})>"
     
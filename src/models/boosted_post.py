@@ -4,7 +4,7 @@ BoostedPost model for tracking reaction-boosted posts
 
 from datetime import datetime
 from typing import List
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, JSON
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -21,7 +21,7 @@ class BoostedPost(Base):
         ForeignKey("channels.id", ondelete="CASCADE"),
         nullable=False
     )
-    post_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    post_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     boost_timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     reaction_count: Mapped[int] = mapped_column(Integer, nullable=False)
     emojis_used: Mapped[List[str]] = mapped_column(JSON, nullable=False)
@@ -29,9 +29,11 @@ class BoostedPost(Base):
     # Relationship to Channel
     channel = relationship("Channel", back_populates="boosted_posts")
     
-    # Create unique index on (channel_id, post_id)
+    # Unique index on (channel_id, post_id); (channel_id, boost_timestamp)
+    # serves a channel's most recent boosts without a sort
     __table_args__ = (
         Index('idx_channel_post', 'channel_id', 'post_id', unique=True),
+        Index('idx_bp_channel_ts', 'channel_id', 'boost_timestamp'),
     )
     
     def __repr__(self) -> str:
@@ -3,21 +3,38 @@ Channel model for storing channel configurations
 """
 
 from typing import List, Optional
-from sqlalchemy import Boolean, Integer, String, Text, JSON
+from sqlalchemy import BigInteger, Boolean, Index, Integer, String, Text, JSON, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
 
+# Native arrays on PostgreSQL so containment can use a GIN index; JSON elsewhere
+_TRIGGER_WORDS_TYPE = JSON().with_variant(ARRAY(String), "postgresql")
+_ADMIN_USER_IDS_TYPE = JSON().with_variant(ARRAY(BigInteger), "postgresql")
+
 
 class Channel(Base, TimestampMixin):
     """Channel configuration model"""
     
     __tablename__ = "channels"
     
+    # Partial index so active-channel lookups and counts avoid a full scan;
+    # GIN index for "channels this user administers", PostgreSQL only like the
+    # bigint[] column it covers
+    __table_args__ = (
+        Index(
+            'ix_channels_active', 'id',
+            postgresql_where=text('is_active'), sqlite_where=text('is_active')
+        ),
+        Index('idx_channel_admins_gin', 'admin_user_ids', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
+    
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    channel_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
+    channel_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
     channel_title: Mapped[str] = mapped_column(String(255), nullable=False)
-    discussion_group_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    discussion_group_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     
     # AI Configuration
     ai_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -27,11 +44,11 @@ class Channel(Base, TimestampMixin):
     daily_limit: Mapped[int] = mapped_column(Integer, default=100)
     rate_limit_minutes: Mapped[int] = mapped_column(Integer, default=5)
     
-    # Trigger words (stored as JSON array)
-    trigger_words: Mapped[List[str]] = mapped_column(JSON, default=list)
+    # Trigger words (text[] on PostgreSQL, JSON array elsewhere); appends are change-tracked
+    trigger_words: Mapped[List[str]] = mapped_column(MutableList.as_mutable(_TRIGGER_WORDS_TYPE), default=list)
     
-    # Admin users (stored as JSON array)
-    admin_user_ids: Mapped[List[int]] = mapped_column(JSON, default=list)
+    # Admin users (bigint[] on PostgreSQL, JSON array elsewhere); appends are change-tracked
+    admin_user_ids: Mapped[List[int]] = mapped_column(MutableList.as_mutable(_ADMIN_USER_IDS_TYPE), default=list)
     
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -39,18 +56,17 @@ class Channel(Base, TimestampMixin):
     # Operational mode: 'comment', 'reaction', or 'both'
     mode: Mapped[str] = mapped_column(String(20), default='comment', nullable=False)
     
-    # Reaction boost settings (JSON)
-    reaction_settings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Reaction boost settings (JSON); top-level key assignments are change-tracked
+    reaction_settings: Mapped[Optional[dict]] = mapped_column(MutableDict.as_mutable(JSON), nullable=True)
     
-    # Relationships
-    comments = relationship("Comment", back_populates="channel", cascade="all, delete-orphan")
-    responses = relationship("Response", back_populates="channel", cascade="all, delete-orphan")
-    templates = relationship("Template", back_populates="channel", cascade="all, delete-orphan")
-    statistics = relationship("Statistics", back_populates="channel", cascade="all, delete-orphan")
-    boosted_posts = relationship("BoostedPost", back_populates="channel", cascade="all, delete-orphan")
-    activity_logs = relationship("ActivityLog", back_populates="channel", cascade="all, delete-orphan")
-    boosted_posts = relationship("BoostedPost", back_populates="channel", cascade="all, delete-orphan")
-    activity_logs = relationship("ActivityLog", back_populates="channel", cascade="all, delete-orphan")
+    # Relationships; never loaded implicitly (async sessions cannot lazy-load),
+    # so callers that need children use selectinload() in their query
+    comments = relationship("Comment", back_populates="channel", cascade="all, delete-orphan", lazy="raise")
+    responses = relationship("Response", back_populates="channel", cascade="all, delete-orphan", lazy="raise")
+    templates = relationship("Template", back_populates="channel", cascade="all, delete-orphan", lazy="raise")
+    statistics = relationship("Statistics", back_populates="channel", cascade="all, delete-orphan", lazy="raise")
+    boosted_posts = relationship("BoostedPost", back_populates="channel", cascade="all, delete-orphan", lazy="raise")
+    activity_logs = relationship("ActivityLog", back_populates="channel", cascade="all, delete-orphan", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Channel(id={self.id}, channel_id={self.channel_id}, title='{self.channel_title}')>"
@@ -4,7 +4,7 @@ Comment model for storing processed comments
 
 from enum import Enum
 from typing import Optional
-from sqlalchemy import Boolean, Integer, String, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import BigInteger, Boolean, Index, Integer, String, Text, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -25,8 +25,8 @@ class Comment(Base, TimestampMixin):
     __tablename__ = "comments"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    message_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    message_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     username: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Content
@@ -47,6 +47,13 @@ class Comment(Base, TimestampMixin):
     channel = relationship("Channel", back_populates="comments")
     responses = relationship("Response", back_populates="comment", cascade="all, delete-orphan")
     
+    # Per-channel lookups by processing state, and one row per group message;
+    # a redelivered update fails the insert instead of being answered twice
+    __table_args__ = (
+        Index('idx_comments_channel_processed', 'channel_id', 'processed'),
+        Index('idx_comments_channel_message', 'channel_id', 'message_id', unique=True),
+    )
+    
     def __repr__(self) -> str:
         return f"<Comment(id={self.id}, user_id={self.user_id}, category={self.category.value})>"
     
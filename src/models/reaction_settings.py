@@ -3,6 +3,7 @@ ReactionSettings dataclass for reaction boost configuration
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 
@@ -24,6 +25,15 @@ class ReactionSettings:
     delay_max: float
     auto_boost: bool
     
+    @cached_property
+    def display_emojis(self) -> str:
+        """
+        The emojis a boost will use, joined for display in messages.
+        
+        Computed on first access; settings are not expected to change afterwards.
+        """
+        return ' '.join(self.emojis[:self.reaction_count])
+    
     def validate(self) -> tuple[bool, Optional[str]]:
         """
         Validate the reaction settings.
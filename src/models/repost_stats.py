@@ -3,7 +3,7 @@ RepostStats model for aggregated statistics per source channel
 """
 
 from sqlalchemy import Column, Integer, JSON, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from datetime import datetime, timezone
 
 from .base import Base, TimestampMixin
@@ -28,8 +28,11 @@ class RepostStats(Base, TimestampMixin):
     last_repost_at = Column(DateTime, nullable=True)
     stats_period_start = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     
-    # Relationship
-    config = relationship("RepostConfig", backref="stats", uselist=False)
+    # Relationship; each config owns exactly one stats row, created and deleted with it
+    config = relationship(
+        "RepostConfig",
+        backref=backref("stats", uselist=False, cascade="all, delete-orphan")
+    )
     
     def __repr__(self):
         return f"<RepostStats(config_id={self.config_id}, total={self.total_reposts}, successful={self.successful_reposts})>"
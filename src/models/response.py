@@ -4,7 +4,7 @@ Response model for storing bot responses
 
 from enum import Enum
 from typing import Optional
-from sqlalchemy import Boolean, Integer, String, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Boolean, Index, Integer, String, Text, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -22,6 +22,11 @@ class Response(Base, TimestampMixin):
     
     __tablename__ = "responses"
     
+    # Index for date-range statistics queries
+    __table_args__ = (
+        Index('idx_responses_created_at', 'created_at'),
+    )
+    
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     response_text: Mapped[str] = mapped_column(Text, nullable=False)
     response_type: Mapped[ResponseType] = mapped_column(
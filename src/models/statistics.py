@@ -3,7 +3,7 @@ Statistics model for tracking bot performance
 """
 
 from datetime import date
-from sqlalchemy import Date, Integer, String, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Date, Index, Integer, String, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -37,6 +37,11 @@ class Statistics(Base, TimestampMixin):
     # Relationships
     channel = relationship("Channel", back_populates="statistics")
     
+    # One row per channel, day and category; also the conflict target for upserts
+    __table_args__ = (
+        Index('ux_stats_channel_date_cat', 'channel_id', 'stat_date', 'category', unique=True),
+    )
+    
     def __repr__(self) -> str:
         return f"<Statistics(id={self.id}, date={self.stat_date}, channel_id={self.channel_id})>"
     
@@ -30,10 +30,9 @@ class AutoRepostService:
         """Check all enabled source channels for new content"""
         try:
             # Get all enabled configs
-            result = await self.session.execute(
+            configs = (await self.session.scalars(
                 select(RepostConfig).where(RepostConfig.is_enabled == True)
-            )
-            configs = result.scalars().all()
+            )).all()
             
             if not configs:
                 logger.info("No enabled repost configs found")
@@ -364,10 +363,9 @@ class AutoRepostService:
         """Update repost statistics"""
         try:
             # Get or create stats record
-            result = await self.session.execute(
+            stats = await self.session.scalar(
                 select(RepostStats).where(RepostStats.config_id == config.id)
             )
-            stats = result.scalar_one_or_none()
             
             if not stats:
                 stats = RepostStats(config_id=config.id)
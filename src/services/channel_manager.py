@@ -7,7 +7,8 @@ from typing import Optional, List
 from aiogram import Bot
 from aiogram.types import Chat, ChatMember
 from aiogram.exceptions import TelegramBadRequest, TelegramAPIError
-from sqlalchemy import select
+from sqlalchemy import BigInteger, select, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from ..config import Config
 from ..database import Database
@@ -94,7 +95,7 @@ class ChannelManager:
             discussion_group_id = await self.detect_discussion_group(channel_id)
             
             # Check if channel already exists
-            async with self.database.get_session() as session:
+            async with self.database.session() as session:
                 existing = await session.execute(
                     select(Channel).where(Channel.channel_id == channel_id)
                 )
@@ -133,15 +134,26 @@ class ChannelManager:
             return None
     
     async def get_user_channels(self, user_id: int) -> List[Channel]:
-        """Get channels where user is admin"""
-        async with self.database.get_session() as session:
-            result = await session.execute(
-                select(Channel).where(
-                    Channel.admin_user_ids.contains([user_id]),
-                    Channel.is_active == True
-                )
+        """Get channels where user is admin
+        
+        On PostgreSQL admin_user_ids is a bigint[] and the containment test
+        runs in SQL against its GIN index; other dialects store a JSON array
+        and filter the active channels in Python.
+        """
+        async with self.database.session() as session:
+            if session.bind.dialect.name == "postgresql":
+                admin_ids = type_coerce(Channel.admin_user_ids, ARRAY(BigInteger))
+                return list((await session.scalars(
+                    select(Channel).where(
+                        admin_ids.contains([user_id]),
+                        Channel.is_active == True
+                    )
+                )).all())
+            
+            channels = await session.scalars(
+                select(Channel).where(Channel.is_active == True)
             )
-            return list(result.scalars().all())
+            return [channel for channel in channels if user_id in (channel.admin_user_ids or ())]
     
     async def validate_bot_permissions(self, channel_id: int) -> dict:
         """Validate bot permissions in channel and return detailed info"""
@@ -188,11 +200,10 @@ class ChannelManager:
     async def remove_channel(self, channel_id: int, user_id: int) -> bool:
         """Remove channel from monitoring (deactivate)"""
         try:
-            async with self.database.get_session() as session:
-                result = await session.execute(
+            async with self.database.session() as session:
+                channel = await session.scalar(
                     select(Channel).where(Channel.channel_id == channel_id)
                 )
-                channel = result.scalar_one_or_none()
                 
                 if not channel:
                     return False
@@ -7,6 +7,7 @@ from typing import Optional
 from aiogram import Bot
 from aiogram.types import Message
 from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
 
 from ..config import Config
@@ -111,6 +112,12 @@ class CommentMonitor:
                 session.add(comment)
                 await session.commit()
                 await session.refresh(comment)
+            except IntegrityError:
+                # Unique (channel_id, message_id): this update was already stored
+                # and answered, e.g. a redelivered webhook
+                await session.rollback()
+                logger.info(f"Skipping duplicate comment {message.message_id} in channel {channel.id}")
+                return
             finally:
                 await session.close()
             
@@ -155,7 +162,7 @@ class CommentMonitor:
         session = await self.database.get_session()
         try:
             # Check blacklist
-            blacklist_check = await session.execute(
+            blacklisted = await session.scalar(
                 select(Blacklist).where(
                     Blacklist.entry_type == BlacklistType.USER,
                     Blacklist.user_id == user_id,
@@ -164,7 +171,7 @@ class CommentMonitor:
                 )
             )
             
-            if blacklist_check.scalar_one_or_none():
+            if blacklisted:
                 return False
             
             # Check rate limiting
@@ -227,10 +234,9 @@ class CommentMonitor:
         """Get rate limit for channel"""
         session = await self.database.get_session()
         try:
-            result = await session.execute(
+            rate_limit = await session.scalar(
                 select(Channel.rate_limit_minutes).where(Channel.id == channel_id)
             )
-            rate_limit = result.scalar_one_or_none()
             return rate_limit or self.config.RATE_LIMIT_MINUTES
         finally:
             await session.close()
@@ -239,10 +245,9 @@ class CommentMonitor:
         """Get daily limit for channel"""
         session = await self.database.get_session()
         try:
-            result = await session.execute(
+            daily_limit = await session.scalar(
                 select(Channel.daily_limit).where(Channel.id == channel_id)
             )
-            daily_limit = result.scalar_one_or_none()
             return daily_limit or self.config.DAILY_RESPONSE_LIMIT
         finally:
             await session.close()
\ No newline at end of file
@@ -109,12 +109,11 @@ class PostMonitorService:
         """
         try:
             # Query for active channels
-            result = await self.db.execute(
+            channels = (await self.db.scalars(
                 select(Channel).where(
                     Channel.is_active == True
                 )
-            )
-            channels = result.scalars().all()
+            )).all()
             return list(channels)
         except Exception as e:
             logger.error(f"Error fetching active channels: {e}", exc_info=True)
@@ -140,13 +140,12 @@ class ReactionBoostService:
         
         Requirements: 3.6
         """
-        result = await self.db.execute(
+        return await self.db.scalar(
             select(BoostedPost).where(
                 BoostedPost.channel_id == channel_id,
                 BoostedPost.post_id == post_id
             )
-        )
-        return result.scalar_one_or_none() is not None
+        ) is not None
     
     def _select_random_emojis(self, settings: ReactionSettings) -> list[str]:
         """
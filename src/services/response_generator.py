@@ -109,15 +109,13 @@ class ResponseGenerator:
         """Get template response for category and channel"""
         session = await self.database.get_session()
         try:
-            result = await session.execute(
+            template = await session.scalar(
                 select(Template).where(
                     Template.channel_id == channel_id,
                     Template.category == category,
                     Template.is_active == True
                 ).order_by(Template.priority.desc())
             )
-            
-            template = result.scalar_one_or_none()
             if template:
                 return template.template_text
             
@@ -165,14 +163,12 @@ class ResponseGenerator:
             session = await self.database.get_session()
             try:
                 # Get last 3 comments before current one
-                result = await session.execute(
+                recent_comments = list((await session.scalars(
                     select(Comment).where(
                         Comment.channel_id == channel_id,
                         Comment.id < current_comment_id
                     ).order_by(Comment.id.desc()).limit(3)
-                )
-                
-                recent_comments = list(result.scalars().all())
+                )).all())
                 
                 if not recent_comments:
                     return ""
@@ -197,7 +193,7 @@ class ResponseGenerator:
             session = await self.database.get_session()
             try:
                 today = date.today()
-                result = await session.execute(
+                greeting = await session.scalar(
                     select(UserGreeting).where(
                         UserGreeting.user_id == user_id,
                         UserGreeting.channel_id == channel_id,
@@ -205,8 +201,6 @@ class ResponseGenerator:
                         UserGreeting.has_greeted == True
                     )
                 )
-                
-                greeting = result.scalar_one_or_none()
                 return greeting is not None
                 
             finally:
@@ -224,7 +218,7 @@ class ResponseGenerator:
                 today = date.today()
                 
                 # Check if record exists
-                result = await session.execute(
+                existing = await session.scalar(
                     select(UserGreeting).where(
                         UserGreeting.user_id == user_id,
                         UserGreeting.channel_id == channel_id,
@@ -232,8 +226,6 @@ class ResponseGenerator:
                     )
                 )
                 
-                existing = result.scalar_one_or_none()
-                
                 if not existing:
                     # Create new greeting record
                     greeting = UserGreeting(
@@ -313,7 +305,7 @@ class ResponseGenerator:
     async def create_template_response(self, channel_id: int, category, name: str, template_text: str) -> Optional[Template]:
         """Create a new template response"""
         try:
-            async with self.database.get_session() as session:
+            async with self.database.session() as session:
                 template = Template(
                     name=name,
                     category=category,
@@ -337,9 +329,8 @@ class ResponseGenerator:
     async def update_template_response(self, template_id: int, template_text: str) -> bool:
         """Update existing template response"""
         try:
-            async with self.database.get_session() as session:
-                result = await session.execute(select(Template).where(Template.id == template_id))
-                template = result.scalar_one_or_none()
+            async with self.database.session() as session:
+                template = await session.get(Template, template_id)
                 
                 if not template:
                     return False
@@ -357,9 +348,8 @@ class ResponseGenerator:
     async def delete_template_response(self, template_id: int) -> bool:
         """Delete template response"""
         try:
-            async with self.database.get_session() as session:
-                result = await session.execute(select(Template).where(Template.id == template_id))
-                template = result.scalar_one_or_none()
+            async with self.database.session() as session:
+                template = await session.get(Template, template_id)
                 
                 if not template:
                     return False
@@ -376,22 +366,19 @@ class ResponseGenerator:
     
     async def get_channel_templates(self, channel_id: int) -> list:
         """Get all templates for a channel"""
-        async with self.database.get_session() as session:
-            result = await session.execute(
+        async with self.database.session() as session:
+            return list((await session.scalars(
                 select(Template).where(
                     Template.channel_id == channel_id,
                     Template.is_active == True
                 ).order_by(Template.category, Template.priority.desc())
-            )
-            
-            return list(result.scalars().all())
+            )).all())
     
     async def test_ai_response(self, test_text: str, channel_id: int) -> Optional[str]:
         """Test AI response generation"""
         try:
-            async with self.database.get_session() as session:
-                result = await session.execute(select(Channel).where(Channel.id == channel_id))
-                channel = result.scalar_one_or_none()
+            async with self.database.session() as session:
+                channel = await session.get(Channel, channel_id)
                 
                 if not channel:
                     return None
@@ -255,3 +255,12 @@ class TestReactionSettingsConversion:
         settings = ReactionSettings.from_dict(original_data)
         converted_data = settings.to_dict()
         assert converted_data == original_data
+    
+    def test_display_emojis(self):
+        """Test that display_emojis joins the emojis used per boost"""
+        settings = ReactionSettings.from_dict({
+            'emojis': ["👍", "❤️", "🔥"],
+            'reaction_count': 2
+        })
+        assert settings.display_emojis == "👍 ❤️"
+        assert settings.display_emojis is settings.display_emojis